@@ -22,10 +22,11 @@ UPSERT仕様（恒久対策として固定）:
 
 import os
 import json
+import tempfile
 import threading
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from queue import Queue, Empty
 import duckdb
 from datetime import datetime
@@ -176,6 +177,23 @@ TABLE_PK_COLS: Dict[str, Set[str]] = {
 }
 
 
+def iter_arrow_rows(cursor, batch_size: int = 10_000) -> Iterator[Tuple[Any, ...]]:
+    """
+    Stream an executed cursor's result as row tuples via Arrow record batches.
+    
+    Values are converted column-by-column per batch (no per-row dicts), so no
+    full fetchall() result is held in memory.
+    """
+    # DuckDB 1.5 renamed fetch_record_batch() to to_arrow_reader()
+    if hasattr(cursor, "to_arrow_reader"):
+        batches = cursor.to_arrow_reader(batch_size)
+    else:
+        batches = cursor.fetch_record_batch(batch_size)
+    
+    for batch in batches:
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
 class DuckDBClient:
     """
     DuckDB client with single-writer guarantee.
@@ -193,17 +211,29 @@ class DuckDBClient:
         Initialize DuckDB client.
         
         Args:
-            db_path: Path to DuckDB database file
+            db_path: Path to DuckDB database file, or ":memory:" for an in-process
+                     database (tests; nothing is written to disk)
             temp_directory: Optional temp directory for DuckDB (default: DBと同じディレクトリ配下)
                            Must be writable and on same filesystem as DB for performance.
         """
-        self.db_path = Path(db_path).absolute()
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # temp_directory規約: DBと同一の書込み可能領域（ローカルSSD）配下に固定
-        if temp_directory is None:
-            # デフォルト: DBと同じディレクトリ配下のduckdb_tmp
-            temp_directory = str(self.db_path.parent / "duckdb_tmp")
+        # ":memory:" はプロセス内のみのDB（テスト用途）。接続を1本に固定して共有する
+        # （DuckDBのin-memory DBは接続ごとに別DBになるため）
+        self.in_memory = db_path == ":memory:"
+        self._memory_conn: Optional[duckdb.DuckDBPyConnection] = None
+        
+        if self.in_memory:
+            self.db_path = Path(":memory:")
+            if temp_directory is None:
+                # デフォルト: システムtemp配下のduckdb_tmp（spill専用）
+                temp_directory = str(Path(tempfile.gettempdir()) / "duckdb_tmp")
+        else:
+            self.db_path = Path(db_path).absolute()
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # temp_directory規約: DBと同一の書込み可能領域（ローカルSSD）配下に固定
+            if temp_directory is None:
+                # デフォルト: DBと同じディレクトリ配下のduckdb_tmp
+                temp_directory = str(self.db_path.parent / "duckdb_tmp")
         
         self.temp_directory = Path(temp_directory).absolute()
         self.temp_directory.mkdir(parents=True, exist_ok=True)
@@ -232,6 +262,19 @@ class DuckDBClient:
         # Initialize database schema if needed
         self._init_schema()
     
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        """
+        Open a connection to the database (internal).
+        
+        In-memory databases share one connection for schema init, writer and
+        readers; file databases get a new connection per call.
+        """
+        if self.in_memory:
+            if self._memory_conn is None:
+                self._memory_conn = duckdb.connect(":memory:")
+            return self._memory_conn
+        return duckdb.connect(str(self.db_path))
+    
     def _init_schema(self):
         """Initialize database schema from schema.sql and apply migrations."""
         schema_path = Path(__file__).parent.parent.parent / "src" / "db" / "schema.sql"
@@ -239,7 +282,7 @@ class DuckDBClient:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         
         # Use a temporary connection to initialize schema
-        conn = duckdb.connect(str(self.db_path))
+        conn = self._connect()
         try:
             # 起動時に必ずSET temp_directoryを実行（規約固定）
             conn.execute(f"SET temp_directory = '{self.temp_directory}'")
@@ -252,7 +295,8 @@ class DuckDBClient:
             # Apply migrations (idempotent, safe to run on every init)
             self._apply_migrations(conn)
         finally:
-            conn.close()
+            if not self.in_memory:
+                conn.close()
     
     def _apply_migrations(self, conn):
         """
@@ -296,6 +340,10 @@ class DuckDBClient:
         if self._writer_conn:
             return self._writer_conn
         
+        # In-memory: the shared connection is the only view of the data
+        if self.in_memory:
+            return self._connect()
+        
         # Fallback: create a regular connection (not read_only)
         conn = duckdb.connect(str(self.db_path))
         # 起動時に必ずSET temp_directoryを実行（規約固定）
@@ -307,6 +355,9 @@ class DuckDBClient:
     
     def close_reader(self, conn: duckdb.DuckDBPyConnection):
         """Close a reader connection."""
+        if self.in_memory and conn is self._memory_conn:
+            # Shared connection owns the in-memory DB; closed in close()
+            return
         try:
             conn.close()
         except Exception:
@@ -321,7 +372,7 @@ class DuckDBClient:
             if self._writer_thread is not None and self._writer_thread.is_alive():
                 return
             
-            self._writer_conn = duckdb.connect(str(self.db_path))
+            self._writer_conn = self._connect()
             
             # 起動時に必ずSET temp_directoryを実行（規約固定）
             self._writer_conn.execute(f"SET temp_directory = '{self.temp_directory}'")
@@ -337,6 +388,17 @@ class DuckDBClient:
                     try:
                         # Get item from queue with timeout
                         item = self._write_queue.get(timeout=1.0)
+                        
+                        # flush() barrier: commit everything queued before it, then signal
+                        if item.get("op") == "flush":
+                            try:
+                                if batch:
+                                    self._process_batch(batch)
+                            finally:
+                                batch = []
+                                item["done"].set()
+                            continue
+                        
                         batch.append(item)
                         
                         # Process batch when full or queue is empty
@@ -404,6 +466,16 @@ class DuckDBClient:
                         sql=item["sql"],
                         params=item.get("params", [])
                     )
+                elif op_type == "execute_many":
+                    self._execute_many(
+                        sql=item["sql"],
+                        params_seq=item["params_seq"]
+                    )
+                elif op_type == "insert_arrow":
+                    self._execute_insert_arrow(
+                        table=item["table"],
+                        arrow_table=item["arrow_table"]
+                    )
                 successful_ops += 1
             except Exception as item_error:
                 # For runs table INSERT with ignore_conflict, log warning but continue
@@ -431,7 +503,7 @@ class DuckDBClient:
                     continue
                 # For execute_sql operations (UPDATE signature_stats, index operations, etc.)
                 # Log warning but continue (some operations are non-critical)
-                elif op_type == "execute_sql":
+                elif op_type in ("execute_sql", "execute_many", "insert_arrow"):
                     error_msg = str(item_error)
                     sql_preview = item.get("sql", "unknown")[:100]  # First 100 chars for logging
                     print(f"  WARNING: Failed to execute SQL: {item_error}", flush=True)
@@ -906,33 +978,127 @@ class DuckDBClient:
                 f"SQL: {sql}, Params: {params}"
             ) from e
     
+    def execute_many(self, sql: str, params_seq: List[Sequence[Any]]):
+        """
+        Queue a parameterized SQL statement executed once per row (non-blocking, Writer Queue経由).
+        
+        Bulk-loads static rows with a single executemany() instead of one queued
+        operation per row. Rows are positional tuples in the column order of `sql`.
+        
+        Args:
+            sql: Parameterized SQL statement (e.g. "INSERT INTO t (a, b) VALUES (?, ?)")
+            params_seq: List of parameter tuples, one per row
+        """
+        self._start_writer()
+        
+        self._write_queue.put({
+            "op": "execute_many",
+            "sql": sql,
+            "params_seq": list(params_seq)
+        })
+    
+    def _execute_many(self, sql: str, params_seq: List[Sequence[Any]]):
+        """
+        Execute parameterized SQL for each row (internal, Writer Queue経由).
+        
+        Args:
+            sql: SQL statement
+            params_seq: Parameter tuples, one per row
+        """
+        if not self._writer_conn:
+            raise RuntimeError("Writer connection not initialized")
+        
+        if not params_seq:
+            return
+        
+        try:
+            self._writer_conn.executemany(sql, params_seq)
+        except Exception as e:
+            raise RuntimeError(
+                f"SQL execution failed: {e}. "
+                f"SQL: {sql}, Rows: {len(params_seq)}"
+            ) from e
+    
+    def insert_arrow(self, table: str, arrow_table):
+        """
+        Queue a bulk INSERT from a pyarrow Table (non-blocking, Writer Queue経由).
+        
+        The Arrow table is registered on the writer connection and inserted with a
+        single INSERT ... SELECT (vectorized, no per-row statement dispatch).
+        Column names must match the target table; missing columns take defaults.
+        
+        Args:
+            table: Target table name
+            arrow_table: pyarrow.Table whose column names are target columns
+        """
+        self._start_writer()
+        
+        self._write_queue.put({
+            "op": "insert_arrow",
+            "table": table,
+            "arrow_table": arrow_table
+        })
+    
+    def _execute_insert_arrow(self, table: str, arrow_table):
+        """
+        Execute INSERT ... SELECT from a registered Arrow table (internal).
+        
+        Args:
+            table: Target table name
+            arrow_table: pyarrow.Table
+        """
+        if not self._writer_conn:
+            raise RuntimeError("Writer connection not initialized")
+        
+        if arrow_table.num_rows == 0:
+            return
+        
+        view_name = f"_insert_arrow_{table}"
+        column_list = ", ".join(arrow_table.column_names)
+        self._writer_conn.register(view_name, arrow_table)
+        try:
+            self._writer_conn.execute(
+                f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {view_name}"
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Arrow INSERT failed for {table}: {e}. "
+                f"Columns: {arrow_table.column_names}, Rows: {arrow_table.num_rows}"
+            ) from e
+        finally:
+            self._writer_conn.unregister(view_name)
+    
     def flush(self, timeout: float = 30.0):
         """
         Wait for all queued writes to complete.
         
+        Enqueues a barrier behind all pending writes; the writer thread processes
+        (and commits) everything queued before it, then signals. Returns as soon
+        as the writes are committed instead of sleeping for a fixed interval.
+        
         Args:
             timeout: Maximum time to wait (seconds)
         """
-        import time
-        start = time.time()
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            return
         
-        while not self._write_queue.empty():
-            if time.time() - start > timeout:
-                raise TimeoutError("Flush timeout")
-            time.sleep(0.1)
+        done = threading.Event()
+        self._write_queue.put({"op": "flush", "done": done})
         
-        # Wait a bit more to ensure batch processing completes
-        # Writer thread processes batches with timeout, so we need to wait
-        time.sleep(1.0)
+        if not done.wait(timeout):
+            raise TimeoutError("Flush timeout")
     
     def close(self):
         """Close all connections and stop writer thread."""
+        # Drain pending writes before signalling shutdown (writer loop exits on shutdown)
+        if self._writer_thread and self._writer_thread.is_alive():
+            self.flush()
+        
         # Signal shutdown
         self._shutdown_event.set()
         
         # Wait for writer thread to finish
         if self._writer_thread and self._writer_thread.is_alive():
-            self.flush()
             self._writer_thread.join(timeout=5.0)
         
         # Close writer connection
@@ -951,6 +1117,14 @@ class DuckDBClient:
                 except Exception:
                     pass
             self._reader_conns.clear()
+        
+        # Close shared in-memory connection (if not already closed as writer)
+        if self._memory_conn is not None:
+            try:
+                self._memory_conn.close()
+            except Exception:
+                pass
+            self._memory_conn = None
     
     def __enter__(self):
         return self
@@ -13,6 +13,38 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 
+# Canonical event schema (based on canonical_event.schema.json)
+CANONICAL_EVENT_SCHEMA = pa.schema([
+    # Required fields
+    pa.field("event_time", pa.string()),  # ISO-8601 string
+    pa.field("vendor", pa.string()),
+    pa.field("log_type", pa.string()),
+    pa.field("user_id", pa.string()),
+    pa.field("dest_host", pa.string()),
+    pa.field("dest_domain", pa.string()),
+    pa.field("url_full", pa.string()),
+    pa.field("action", pa.string()),
+    pa.field("bytes_sent", pa.int64()),
+    pa.field("bytes_received", pa.int64()),
+    pa.field("ingest_file", pa.string()),
+    pa.field("ingest_lineage_hash", pa.string()),
+    
+    # Optional fields
+    pa.field("user_dept", pa.string()),
+    pa.field("device_id", pa.string()),
+    pa.field("src_ip", pa.string()),
+    pa.field("url_path", pa.string()),
+    pa.field("url_query", pa.string()),
+    pa.field("http_method", pa.string()),
+    pa.field("status_code", pa.int64()),  # Nullable
+    pa.field("app_name", pa.string()),
+    pa.field("app_category", pa.string()),
+    pa.field("content_type", pa.string()),
+    pa.field("user_agent", pa.string()),
+    pa.field("raw_event_id", pa.string()),
+])
+
+
 class ParquetWriter:
     """
     Writes canonical events to Parquet files in Hive partition format.
@@ -54,6 +86,57 @@ class ParquetWriter:
         if date_partition is None:
             date_partition = self._extract_date_partition(events)
         
+        return self._write_partition(lambda: self._events_to_table(events),
+                                     vendor, run_id, date_partition)
+    
+    def write_events_table(self,
+                           table: pa.Table,
+                           vendor: str,
+                           run_id: str,
+                           date_partition: Optional[str] = None) -> Path:
+        """
+        Write a columnar table of events to Parquet in Hive partition format.
+        
+        Columnar counterpart of write_events: callers that already hold
+        per-column data skip the per-event dicts. Columns are aligned to the
+        canonical schema (missing optional columns become nulls, extra
+        columns are dropped).
+        
+        Args:
+            table: PyArrow Table of canonical events
+            vendor: Vendor name (e.g., "paloalto")
+            run_id: Run ID for file naming
+            date_partition: Date partition (YYYY-MM-DD). If None, extracted from the first row.
+            
+        Returns:
+            Path to written Parquet file
+        """
+        if table.num_rows == 0:
+            raise ValueError("Cannot write empty event table")
+        
+        if date_partition is None:
+            first_event = {}
+            if "event_time" in table.column_names:
+                first_event["event_time"] = table.column("event_time")[0].as_py()
+            date_partition = self._extract_date_partition([first_event])
+        
+        return self._write_partition(lambda: self._conform_table(table),
+                                     vendor, run_id, date_partition)
+    
+    def _write_partition(self, build_table, vendor: str, run_id: str,
+                         date_partition: str) -> Path:
+        """
+        Build the table and write it atomically into its partition.
+        
+        Args:
+            build_table: Callable returning the canonical PyArrow Table
+            vendor: Vendor name
+            run_id: Run ID for file naming
+            date_partition: Date partition (YYYY-MM-DD)
+            
+        Returns:
+            Path to written Parquet file
+        """
         # Build partition path: vendor=<v>/date=<YYYY-MM-DD>
         partition_path = self.base_dir / f"vendor={vendor}" / f"date={date_partition}"
         partition_path.mkdir(parents=True, exist_ok=True)
@@ -68,7 +151,7 @@ class ParquetWriter:
         
         try:
             # Convert events to PyArrow Table
-            table = self._events_to_table(events)
+            table = build_table()
             
             # Write Parquet file with Snappy compression
             # Note: use_dictionary=False to avoid type conflicts when reading as dataset
@@ -145,36 +228,7 @@ class ParquetWriter:
         Returns:
             PyArrow Table
         """
-        # Define schema based on canonical_event.schema.json
-        schema = pa.schema([
-            # Required fields
-            pa.field("event_time", pa.string()),  # ISO-8601 string
-            pa.field("vendor", pa.string()),
-            pa.field("log_type", pa.string()),
-            pa.field("user_id", pa.string()),
-            pa.field("dest_host", pa.string()),
-            pa.field("dest_domain", pa.string()),
-            pa.field("url_full", pa.string()),
-            pa.field("action", pa.string()),
-            pa.field("bytes_sent", pa.int64()),
-            pa.field("bytes_received", pa.int64()),
-            pa.field("ingest_file", pa.string()),
-            pa.field("ingest_lineage_hash", pa.string()),
-            
-            # Optional fields
-            pa.field("user_dept", pa.string()),
-            pa.field("device_id", pa.string()),
-            pa.field("src_ip", pa.string()),
-            pa.field("url_path", pa.string()),
-            pa.field("url_query", pa.string()),
-            pa.field("http_method", pa.string()),
-            pa.field("status_code", pa.int64()),  # Nullable
-            pa.field("app_name", pa.string()),
-            pa.field("app_category", pa.string()),
-            pa.field("content_type", pa.string()),
-            pa.field("user_agent", pa.string()),
-            pa.field("raw_event_id", pa.string()),
-        ])
+        schema = CANONICAL_EVENT_SCHEMA
         
         # Convert events to arrays
         arrays = []
@@ -213,6 +267,25 @@ class ParquetWriter:
         
         return table
     
+    def _conform_table(self, table: pa.Table) -> pa.Table:
+        """
+        Align a columnar event table to the canonical schema.
+        
+        Args:
+            table: PyArrow Table with canonical column names
+            
+        Returns:
+            PyArrow Table with CANONICAL_EVENT_SCHEMA
+        """
+        arrays = []
+        for field in CANONICAL_EVENT_SCHEMA:
+            if field.name in table.column_names:
+                arrays.append(table.column(field.name).cast(field.type))
+            else:
+                arrays.append(pa.nulls(table.num_rows, type=field.type))
+        
+        return pa.Table.from_arrays(arrays, schema=CANONICAL_EVENT_SCHEMA)
+    
     def get_partition_path(self, vendor: str, date_partition: str) -> Path:
         """
         Get partition path for given vendor and date.
@@ -6,18 +6,33 @@ Provides orchestration utilities including file stabilization for Box sync.
 
 # Re-export Orchestrator and RunContext from parent orchestrator.py
 # This allows: from orchestrator import Orchestrator, RunContext
-# to work even though orchestrator.py is in the parent directory
+# to work even though orchestrator.py is in the parent directory.
+# orchestrator.py (DuckDB, signature builder) is loaded on first access, so
+# importing a submodule such as orchestrator.file_stabilizer stays cheap.
 import importlib.util
 from pathlib import Path
 
-# Load orchestrator.py from parent directory
-orchestrator_file = Path(__file__).parent.parent / "orchestrator.py"
-spec = importlib.util.spec_from_file_location("orchestrator_module", orchestrator_file)
-orchestrator_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(orchestrator_module)
+__all__ = ['Orchestrator', 'RunContext']
 
-# Re-export
-Orchestrator = orchestrator_module.Orchestrator
-RunContext = orchestrator_module.RunContext
 
-__all__ = ['Orchestrator', 'RunContext']
+def _load_orchestrator_module():
+    """Load orchestrator.py from parent directory."""
+    orchestrator_file = Path(__file__).parent.parent / "orchestrator.py"
+    spec = importlib.util.spec_from_file_location("orchestrator_module", orchestrator_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def __getattr__(name):
+    if name in __all__ or name == "orchestrator_module":
+        module = _load_orchestrator_module()
+
+        # Re-export (cached as module globals; __getattr__ is not hit again)
+        globals().update(
+            orchestrator_module=module,
+            Orchestrator=module.Orchestrator,
+            RunContext=module.RunContext,
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
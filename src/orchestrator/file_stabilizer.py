@@ -6,13 +6,23 @@ Ensures atomicity by waiting for files to stabilize before processing.
 """
 
 import time
+import copy
 import shutil
+import tempfile
+import threading
 import os
+import sys
+import errno
+import hashlib
+import select
+import struct
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import yaml
 import fnmatch
+import re
 import logging
 
 # Configure logging (use print for now, can be enhanced later)
@@ -24,6 +34,266 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
+# inotify(7) constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+
+class _DirectoryWatch:
+    """
+    Linux inotify watch on a file's parent directory, filtered to that file.
+    
+    Used by wait_for_stable to sleep until the file is touched instead of
+    polling stat(). open() returns None where inotify is unavailable (macOS,
+    Windows, exhausted watch limits); callers then fall back to polling.
+    """
+    
+    _MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    _libc = None
+    
+    def __init__(self, fd: int, name: bytes):
+        self._fd = fd
+        self._name = name
+    
+    @classmethod
+    def open(cls, file_path: Path) -> Optional["_DirectoryWatch"]:
+        """Start watching file_path, or return None if inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            if cls._libc is None:
+                import ctypes
+                import ctypes.util
+                cls._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            libc = cls._libc
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, os.fsencode(file_path.parent), cls._MASK) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return cls(fd, os.fsencode(file_path.name))
+    
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until the watched file is touched or timeout elapses.
+        
+        Returns:
+            True if an event for the file arrived (pending events are drained)
+        """
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return False
+            if self._drain():
+                return True
+    
+    def _drain(self) -> bool:
+        """Read all queued events; True if any names the watched file."""
+        touched = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            offset = 0
+            while offset < len(buf):
+                _, _, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                if buf[offset:offset + name_len].rstrip(b"\0") == self._name:
+                    touched = True
+                offset += name_len
+    
+    def close(self):
+        """Release the inotify descriptor (and its watch)."""
+        os.close(self._fd)
+
+
+# Longest a watched wait blocks before re-checking the stop event
+_STOP_CHECK_SECONDS = 0.5
+
+# Bytes at the end of a file hashed on each stability check
+_STABILITY_TAIL_BYTES = 64 * 1024
+
+# Userspace copy buffer (one read()/write() pair per MiB instead of per 64 KiB)
+_COPY_BUFSIZE = 1 << 20
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): reflink on btrfs/XFS/overlayfs
+_FICLONE = 0x40049409
+
+# errnos meaning "this copy path is not available here", not a real I/O error
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTTY, errno.EBADF, errno.EPERM, errno.ENOTSUP,
+})
+
+
+def _read_tail(f, size: int) -> bytes:
+    """
+    Read the last _STABILITY_TAIL_BYTES of an open file (one pread where available).
+    
+    Not mmap: the file is still being written by the sync client, and a
+    truncate under a live mapping turns the tail slice into SIGBUS.
+    """
+    offset = max(size - _STABILITY_TAIL_BYTES, 0)
+    if hasattr(os, "pread"):
+        return os.pread(f.fileno(), _STABILITY_TAIL_BYTES, offset)
+    f.seek(offset)
+    return f.read(_STABILITY_TAIL_BYTES)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst (copy-on-write, O(metadata)); False if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError as e:
+        if e.errno in _COPY_FALLBACK_ERRNOS:
+            return False
+        raise
+    return True
+
+
+def _kernel_copy(copy_chunk, src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy size bytes with an in-kernel call (os.copy_file_range / os.sendfile).
+    
+    Returns False (with dst emptied again) if the call is unsupported for
+    these files, or stops short of size (some FUSE/network filesystems
+    return 0 instead of an error), so the caller can try the next path.
+    """
+    offset = 0
+    try:
+        while offset < size:
+            copied = copy_chunk(src_fd, dst_fd, offset, size - offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError as e:
+        if e.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+        offset = -1
+    if offset != size:
+        os.ftruncate(dst_fd, 0)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        return False
+    return True
+
+
+def _buffered_copy(fsrc, fdst, size: int) -> None:
+    """
+    Copy the first size bytes of fsrc to fdst through one reused buffer.
+    
+    Stops at size even if the source has grown since it was measured (like
+    the kernel paths); stops early at EOF if it has shrunk.
+    """
+    buf = memoryview(bytearray(max(1, min(_COPY_BUFSIZE, size))))
+    remaining = size
+    while remaining:
+        n = fsrc.readinto(buf[:min(remaining, len(buf))])
+        if not n:
+            break
+        fdst.write(buf[:n])
+        remaining -= n
+
+
+def _fastcopy(src: Path, dst: Path) -> None:
+    """
+    Copy file contents and metadata (like shutil.copy2) via the cheapest path.
+    
+    Tries, in order: reflink (FICLONE), os.copy_file_range, os.sendfile, then
+    a userspace copy with a 1 MiB buffer. The kernel paths avoid moving the
+    bytes through Python; each falls through when the filesystem or platform
+    rejects it.
+    
+    The bytes go to a temporary file next to dst, which replaces dst only once
+    it holds exactly the source size measured at open; on any failure it is
+    removed, so dst never exists as a partial copy (callers reuse an existing
+    dst as already copied).
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as fdst, open(src, 'rb') as fsrc:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            
+            copied = _reflink(src_fd, dst_fd)
+            if copied and os.fstat(dst_fd).st_size > size:
+                # Clone took bytes appended after the size was measured
+                os.ftruncate(dst_fd, size)
+            if not copied and hasattr(os, "copy_file_range"):
+                copied = _kernel_copy(
+                    lambda i, o, off, count: os.copy_file_range(i, o, count, off),
+                    src_fd, dst_fd, size
+                )
+            if not copied and sys.platform.startswith("linux"):
+                # sendfile writes at the current output offset (0 after open/rewind)
+                copied = _kernel_copy(
+                    lambda i, o, off, count: os.sendfile(o, i, off, count),
+                    src_fd, dst_fd, size
+                )
+            if not copied:
+                _buffered_copy(fsrc, fdst, size)
+            
+            # Never hand a short copy to the pipeline as a stabilized input
+            fdst.flush()
+            copied_size = os.fstat(dst_fd).st_size
+            if copied_size != size:
+                raise OSError(errno.EIO, f"Short copy: {copied_size} of {size} bytes", str(dst))
+        
+        shutil.copystat(src, tmp_name)
+        os.replace(tmp_name, dst)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+@lru_cache(maxsize=32)
+def _load_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse box_sync.yaml once per (path, mtime, size); editing the file invalidates it.
+    
+    The cached dict is shared: callers must copy before mutating.
+    """
+    import yaml  # deferred: only needed when a FileStabilizer is built
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    """True if path lies under directory (string prefix on a path boundary)."""
+    return str(path).startswith(os.path.join(str(directory), ""))
+
+
+def _compile_patterns(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+    """
+    Translate glob patterns into one compiled regex (None if no patterns).
+    
+    Equivalent to fnmatch.fnmatch against each pattern in turn, but each
+    filename is matched once instead of once per pattern.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
 class FileStabilizer:
     """
     Stabilizes files from Box sync folder before processing.
@@ -46,8 +316,10 @@ class FileStabilizer:
         if config_path is None:
             config_path = Path(__file__).parent.parent.parent / "config" / "box_sync.yaml"
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+        config_stat = Path(config_path).stat()
+        self.config = copy.deepcopy(
+            _load_config(str(config_path), config_stat.st_mtime_ns, config_stat.st_size)
+        )
         
         # Get stabilization settings
         # Priority: 1) Environment variable, 2) Config file, 3) Default (60)
@@ -65,6 +337,17 @@ class FileStabilizer:
         self.poll_interval_seconds = stabilization.get("poll_interval_seconds", 5)
         self.max_wait_seconds = stabilization.get("max_wait_seconds", 600)
         
+        # Files stabilized/copied concurrently by process_input_files
+        # Priority: 1) Environment variable, 2) Config file, 3) Default (8)
+        self.max_workers = stabilization.get("max_workers", 8)
+        env_workers = os.getenv("AIMO_STABILIZER_WORKERS")
+        if env_workers:
+            try:
+                self.max_workers = int(env_workers)
+            except ValueError:
+                logger.warning(f"Invalid AIMO_STABILIZER_WORKERS environment variable: {env_workers}, using config/default")
+        self.max_workers = max(1, self.max_workers)
+        
         # JSONL logger for audit logging
         self.jsonl_logger = jsonl_logger
         
@@ -72,6 +355,8 @@ class FileStabilizer:
         file_handling = self.config.get("file_handling", {})
         self.include_patterns = file_handling.get("include_patterns", ["*.csv", "*.json", "*.log", "*.txt"])
         self.exclude_patterns = file_handling.get("exclude_patterns", [".*", "*.tmp", "*.partial"])
+        self._include_re = _compile_patterns(self.include_patterns)
+        self._exclude_re = _compile_patterns(self.exclude_patterns)
         
         # Get sync paths
         # Box sync is now mandatory (P0: prevent incomplete file processing)
@@ -90,41 +375,38 @@ class FileStabilizer:
         work_config = self.config.get("work", {})
         self.work_base_path = Path(work_config.get("base_path", "./data/work"))
     
-    def _matches_pattern(self, filename: str, patterns: List[str]) -> bool:
+    def _should_process_file(self, file_path: Path) -> bool:
         """
-        Check if filename matches any pattern in patterns list.
+        Check if file should be processed based on include/exclude patterns.
         
         Args:
-            filename: Filename to check
-            patterns: List of glob patterns
+            file_path: Path to file
             
         Returns:
-            True if filename matches any pattern
+            True if file should be processed
         """
-        for pattern in patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return self._should_process_name(file_path.name)
     
-    def _should_process_file(self, file_path: Path) -> bool:
+    def _should_process_name(self, filename: str) -> bool:
         """
-        Check if file should be processed based on include/exclude patterns.
+        Check a bare filename against the include/exclude patterns.
         
         Args:
-            file_path: Path to file
+            filename: Filename to check
             
         Returns:
             True if file should be processed
         """
-        filename = file_path.name
+        # Same case handling as fnmatch.fnmatch (case-insensitive on Windows)
+        filename = os.path.normcase(filename)
         
         # Check exclude patterns first (higher priority)
-        if self._matches_pattern(filename, self.exclude_patterns):
+        if self._exclude_re is not None and self._exclude_re.match(filename):
             return False
         
         # Check include patterns
-        if self.include_patterns:
-            return self._matches_pattern(filename, self.include_patterns)
+        if self._include_re is not None:
+            return self._include_re.match(filename) is not None
         
         # If no include patterns, accept all (except excluded)
         return True
@@ -142,35 +424,69 @@ class FileStabilizer:
         
         input_files = []
         
-        # Recursively search for files
-        for file_path in self.input_path.rglob("*"):
-            if file_path.is_file() and self._should_process_file(file_path):
-                input_files.append(file_path)
+        # Recursively search for files with os.scandir: names and file types
+        # come from the directory listing, so filtered-out entries cost no stat()
+        # (symlinked directories are not descended, as with Path.rglob)
+        pending = [self.input_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        elif self._should_process_name(entry.name) and entry.is_file():
+                            input_files.append(Path(entry.path))
+            except OSError as e:
+                # Unreadable folder (or input path not a directory): skip it
+                # and keep scanning, as Path.rglob does
+                logger.warning(f"Cannot list directory {directory}: {e}")
+                continue
         
         return sorted(input_files)  # Sort for determinism
     
     def _get_file_stats(self, file_path: Path) -> Dict[str, Any]:
         """
-        Get file statistics (size, mtime).
+        Get file statistics (size, mtime) and a hash of the file's tail.
+        
+        The tail hash (last _STABILITY_TAIL_BYTES) catches in-place rewrites
+        that keep both size and mtime (coarse timestamps, sync clients that
+        restore the remote mtime) without reading the whole file.
         
         Args:
             file_path: Path to file
             
         Returns:
-            Dict with 'size' and 'mtime' keys
+            Dict with 'size', 'mtime', 'mtime_ns' and 'tail_hash' keys
         """
-        stat = file_path.stat()
+        try:
+            with open(file_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                tail = _read_tail(f, stat.st_size)
+                tail_hash = hashlib.blake2b(tail, digest_size=16).hexdigest()
+        except PermissionError:
+            # Locked by the writer (sync client): size/mtime still apply
+            stat = file_path.stat()
+            tail_hash = None
         return {
             "size": stat.st_size,
-            "mtime": stat.st_mtime
+            "mtime": stat.st_mtime,
+            "mtime_ns": stat.st_mtime_ns,
+            "tail_hash": tail_hash
         }
     
-    def wait_for_stable(self, file_path: Path) -> Dict[str, Any]:
+    def wait_for_stable(self, file_path: Path, show_progress: bool = True,
+                        stop: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Wait for file to stabilize (no changes for wait_seconds).
         
         Args:
             file_path: Path to file to stabilize
+            show_progress: Print the in-place "Stable for ..." countdown (off
+                when several files are stabilized concurrently, where '\r'
+                lines from different files would overwrite each other)
+            stop: Optional event; once set, the wait gives up (Ctrl-C in
+                process_input_files) and reports failure
             
         Returns:
             Dict with 'success' (bool) and 'metadata' (dict) containing:
@@ -183,17 +499,53 @@ class FileStabilizer:
             logger.warning(f"File does not exist: {file_path}")
             return {"success": False, "metadata": {"error": "File does not exist"}}
         
-        start_time = time.time()
+        # Event-driven wait where inotify is available; polling otherwise
+        watch = _DirectoryWatch.open(file_path)
+        try:
+            return self._wait_until_stable(file_path, watch, show_progress, stop)
+        finally:
+            if watch is not None:
+                watch.close()
+    
+    def _wait_until_stable(self, file_path: Path, watch: Optional[_DirectoryWatch],
+                           show_progress: bool = True,
+                           stop: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Stabilization loop behind wait_for_stable.
+        
+        The _get_file_stats comparison alone decides stability. With a watch,
+        a quiet file is not re-polled: the loop sleeps until the file is
+        touched or would count as stable, then checks once more (a change made
+        without an event, e.g. on a network mount, is still caught by that
+        check and only delays stabilization). While the file keeps changing, or without a
+        watch, it polls every poll_interval_seconds.
+        """
+        # Monotonic clock: NTP steps / DST changes cannot stretch or cut the wait
+        start_time = time.monotonic()
         last_stats = None
         stable_since = None
         change_count = 0
         initial_stats = None
+        changed = False
         
         print(f"  Waiting for file to stabilize: {file_path.name} (max {self.max_wait_seconds}s)")
         
         while True:
+            # One clock sample per iteration; checks below are relative to it
+            now = time.monotonic()
+            
+            elapsed = now - start_time
+            if stop is not None and stop.is_set():
+                metadata = {
+                    "error": "Interrupted",
+                    "initial_size": initial_stats["size"] if initial_stats else None,
+                    "initial_mtime": initial_stats["mtime"] if initial_stats else None,
+                    "wait_duration_seconds": elapsed,
+                    "change_count": change_count
+                }
+                return {"success": False, "metadata": metadata}
+            
             # Check if max wait time exceeded
-            elapsed = time.time() - start_time
             if elapsed > self.max_wait_seconds:
                 logger.warning(
                     f"Max wait time ({self.max_wait_seconds}s) exceeded for {file_path.name}. "
@@ -218,62 +570,71 @@ class FileStabilizer:
                     "error": "File disappeared",
                     "initial_size": initial_stats["size"] if initial_stats else None,
                     "initial_mtime": initial_stats["mtime"] if initial_stats else None,
-                    "wait_duration_seconds": time.time() - start_time,
+                    "wait_duration_seconds": elapsed,
                     "change_count": change_count
                 }
                 return {"success": False, "metadata": metadata}
             
             # Check if stats changed
+            changed = False
             if last_stats is None:
                 # First check
                 initial_stats = current_stats.copy()
                 last_stats = current_stats
-                stable_since = time.time()
+                stable_since = now
             elif (current_stats["size"] != last_stats["size"] or 
-                  current_stats["mtime"] != last_stats["mtime"]):
+                  current_stats["mtime_ns"] != last_stats["mtime_ns"] or
+                  current_stats["tail_hash"] != last_stats["tail_hash"]):
                 # Stats changed - reset stable timer
+                changed = True
                 change_count += 1
                 last_stats = current_stats
-                stable_since = time.time()
+                stable_since = now
                 print(f"    File changed: {file_path.name} (size: {current_stats['size']}, resetting timer...)")
             else:
                 # Stats unchanged - check if stable long enough
-                stable_duration = time.time() - stable_since
+                stable_duration = now - stable_since
                 remaining = self.wait_seconds - stable_duration
-                if remaining > 0:
-                    print(f"    Stable for {stable_duration:.1f}s, need {remaining:.1f}s more...", end='\r')
+                if remaining > 0 and show_progress:
+                    print(f"    {file_path.name}: stable for {stable_duration:.1f}s, need {remaining:.1f}s more...", end='\r')
                 if stable_duration >= self.wait_seconds:
                     print(f"  File stabilized: {file_path.name} (stable for {stable_duration:.1f}s)")
-                    wait_duration = time.time() - start_time
                     metadata = {
                         "initial_size": initial_stats["size"],
                         "initial_mtime": initial_stats["mtime"],
                         "final_size": current_stats["size"],
                         "final_mtime": current_stats["mtime"],
-                        "wait_duration_seconds": wait_duration,
+                        "wait_duration_seconds": elapsed,
                         "stable_duration_seconds": stable_duration,
                         "change_count": change_count
                     }
                     return {"success": True, "metadata": metadata}
             
             # Wait before next check
-            time.sleep(self.poll_interval_seconds)
+            if watch is None or changed:
+                if stop is None:
+                    time.sleep(self.poll_interval_seconds)
+                else:
+                    stop.wait(self.poll_interval_seconds)
+            else:
+                deadline = min(stable_since + self.wait_seconds, start_time + self.max_wait_seconds)
+                if stop is None:
+                    watch.wait(deadline - time.monotonic())
+                else:
+                    # Block in short slices so a set stop event is seen promptly
+                    while not stop.is_set():
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or watch.wait(min(remaining, _STOP_CHECK_SECONDS)):
+                            break
     
-    def copy_to_work_dir(self, file_path: Path, work_dir: Path) -> Path:
-        """
-        Copy stabilized file to work directory.
-        
-        Args:
-            file_path: Source file path (in input/sync folder)
-            work_dir: Destination work directory (data/work/run_id/raw/)
-            
-        Returns:
-            Path to copied file in work directory
-        """
-        # Create raw subdirectory
+    def _ensure_raw_dir(self, work_dir: Path) -> Path:
+        """Create work_dir/raw/ (once per run) and return it."""
         raw_dir = work_dir / "raw"
         raw_dir.mkdir(parents=True, exist_ok=True)
-        
+        return raw_dir
+    
+    def _copy_one(self, file_path: Path, raw_dir: Path) -> Path:
+        """Copy file_path into an existing raw/ directory (see copy_to_work_dir)."""
         # Destination path (preserve original filename)
         dest_path = raw_dir / file_path.name
         
@@ -282,13 +643,26 @@ class FileStabilizer:
             print(f"  File already exists in work directory: {dest_path.name} (reusing)")
             return dest_path
         
-        # Copy file (atomic: use shutil.copy2 to preserve metadata)
+        # Copy file (preserves metadata like shutil.copy2)
         print(f"  Copying {file_path.name} to work directory...")
-        shutil.copy2(file_path, dest_path)
+        _fastcopy(file_path, dest_path)
         
         print(f"  Copied to: {dest_path}")
         return dest_path
     
+    def copy_to_work_dir(self, file_path: Path, work_dir: Path) -> Path:
+        """
+        Copy stabilized file to work directory.
+        
+        Args:
+            file_path: Source file path (in input/sync folder)
+            work_dir: Destination work directory (data/work/run_id/raw/)
+            
+        Returns:
+            Path to copied file in work directory
+        """
+        return self._copy_one(file_path, self._ensure_raw_dir(work_dir))
+    
     def stabilize_and_copy(self, file_path: Path, work_dir: Path, run_id: Optional[str] = None) -> Optional[Path]:
         """
         Stabilize file and copy to work directory.
@@ -301,8 +675,14 @@ class FileStabilizer:
         Returns:
             Path to copied file, or None if stabilization failed
         """
+        return self._stabilize_and_copy(file_path, self._ensure_raw_dir(work_dir), run_id)
+    
+    def _stabilize_and_copy(self, file_path: Path, raw_dir: Path, run_id: Optional[str],
+                            show_progress: bool = True,
+                            stop: Optional[threading.Event] = None) -> Optional[Path]:
+        """stabilize_and_copy into an existing raw/ directory."""
         # Wait for file to stabilize
-        stabilization_result = self.wait_for_stable(file_path)
+        stabilization_result = self.wait_for_stable(file_path, show_progress=show_progress, stop=stop)
         if not stabilization_result["success"]:
             logger.error(f"Failed to stabilize file: {file_path}")
             # Log failure to audit log
@@ -321,25 +701,17 @@ class FileStabilizer:
         
         # Copy to work directory
         try:
-            copied_path = self.copy_to_work_dir(file_path, work_dir)
+            copied_path = self._copy_one(file_path, raw_dir)
             
             # Log successful stabilization to audit log
             if self.jsonl_logger:
-                self.jsonl_logger.log({
-                    "event_type": "file_stabilized",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "run_id": run_id,
-                    "source_path": str(file_path),
-                    "dest_path": str(copied_path),
-                    "initial_size": metadata["initial_size"],
-                    "initial_mtime": metadata["initial_mtime"],
-                    "final_size": metadata["final_size"],
-                    "final_mtime": metadata["final_mtime"],
-                    "wait_duration_seconds": metadata["wait_duration_seconds"],
-                    "stable_duration_seconds": metadata["stable_duration_seconds"],
-                    "change_count": metadata["change_count"],
-                    "stability_seconds": self.wait_seconds
-                })
+                self.jsonl_logger.log_file_stabilized(
+                    run_id=run_id,
+                    source_path=str(file_path),
+                    dest_path=str(copied_path),
+                    metadata=metadata,
+                    stability_seconds=self.wait_seconds
+                )
             
             return copied_path
         except Exception as e:
@@ -376,11 +748,47 @@ class FileStabilizer:
         
         print(f"Found {len(input_files)} input file(s) to process")
         
-        # Stabilize and copy each file
+        # Stabilize and copy files concurrently: each mostly waits (stability
+        # window, Box/network I/O). Files sharing a name map to the same
+        # raw/<name>, so they stay in one task and run in order as before.
+        groups: Dict[str, List[int]] = {}
+        for index, input_file in enumerate(input_files):
+            groups.setdefault(input_file.name, []).append(index)
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Created once here, not per copied file
+        raw_dir = self._ensure_raw_dir(work_dir)
+        results: List[Optional[Path]] = [None] * len(input_files)
+        workers = min(self.max_workers, len(groups))
+        # Set on Ctrl-C so running workers stop waiting for their files
+        stop = threading.Event()
+        
+        def process_group(indices: List[int]):
+            for index in indices:
+                if stop.is_set():
+                    return
+                print(f"Processing: {input_files[index]}")
+                # Only line-based progress while other files print concurrently
+                results[index] = self._stabilize_and_copy(input_files[index], raw_dir, run_id,
+                                                          show_progress=workers == 1, stop=stop)
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(process_group, indices) for indices in groups.values()]
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Not shutdown(wait=True): it would block until every worker had
+            # waited out its stability window
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        
+        # Report in input order (deterministic regardless of completion order)
         copied_files = []
-        for input_file in input_files:
-            print(f"Processing: {input_file}")
-            copied_path = self.stabilize_and_copy(input_file, work_dir, run_id=run_id)
+        for input_file, copied_path in zip(input_files, results):
             if copied_path:
                 copied_files.append(copied_path)
             else:
@@ -405,26 +813,30 @@ class FileStabilizer:
         Returns:
             Path to file in work directory, or None if preparation failed
         """
-        input_file = Path(input_file).resolve()
-        work_dir = Path(work_dir).resolve()
+        # Classify on lexical absolute paths first (no filesystem calls); only
+        # if that places the file in neither directory, resolve symlinks and
+        # retry (e.g. /var vs /private/var on macOS), so a symlinked spelling
+        # never skips stabilization
+        input_file = Path(os.path.abspath(input_file))
+        work_dir = Path(os.path.abspath(work_dir))
+        input_path = Path(os.path.abspath(self.input_path))
+        in_work_dir = _is_within(input_file, work_dir)
+        in_input_dir = _is_within(input_file, input_path)
+        if not (in_work_dir or in_input_dir):
+            input_file, work_dir, input_path = input_file.resolve(), work_dir.resolve(), input_path.resolve()
+            in_work_dir = _is_within(input_file, work_dir)
+            in_input_dir = _is_within(input_file, input_path)
         
         # Check if file is already in work directory (idempotent: reuse)
-        try:
-            if str(input_file).startswith(str(work_dir)):
-                print(f"File already in work directory: {input_file} (reusing)")
-                return input_file
-        except Exception:
-            pass
+        if in_work_dir:
+            print(f"File already in work directory: {input_file} (reusing)")
+            return input_file
         
         # Check if file is in input directory (needs stabilization)
-        input_path = Path(self.input_path).resolve()
-        try:
-            if str(input_file).startswith(str(input_path)):
-                # File is in input directory - stabilize and copy
-                print(f"File is in input directory, stabilizing and copying: {input_file}")
-                return self.stabilize_and_copy(input_file, work_dir, run_id=run_id)
-        except Exception:
-            pass
+        if in_input_dir:
+            # File is in input directory - stabilize and copy
+            print(f"File is in input directory, stabilizing and copying: {input_file}")
+            return self.stabilize_and_copy(input_file, work_dir, run_id=run_id)
         
         # File is outside both input and work directories
         # For direct file specification, copy directly without stabilization
@@ -7,7 +7,7 @@ Logs are written to logs/ directory with daily rotation.
 Features:
 - JSONL format (one JSON object per line)
 - Daily log file rotation (logs/YYYY-MM-DD.jsonl)
-- Atomic writes (.tmp -> rename())
+- Append-only writes (one O_APPEND write() per complete line)
 - Required fields: run start/end, input files, counts, errors, exclusions
 """
 
@@ -19,13 +19,17 @@ from typing import Optional, Dict, Any, List
 from threading import Lock
 
 
+# Shared encoder: json.dumps(..., ensure_ascii=False) builds a new JSONEncoder per call
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 class JSONLLogger:
     """
     Structured logger that writes JSONL format logs.
     
     Features:
     - Daily log file rotation
-    - Atomic writes (tmp -> rename)
+    - Append-only writes on a long-lived O_APPEND descriptor
     - Thread-safe logging
     - Required audit fields
     """
@@ -42,6 +46,7 @@ class JSONLLogger:
         self._lock = Lock()
         self._current_log_file: Optional[Path] = None
         self._current_date: Optional[str] = None
+        self._fd: Optional[int] = None
     
     def _get_log_file_path(self, date: Optional[str] = None) -> Path:
         """
@@ -69,11 +74,47 @@ class JSONLLogger:
         
         # Check if we need to rotate
         if self._current_date != today:
+            self._close_fd()
             self._current_date = today
             self._current_log_file = self._get_log_file_path(today)
         
         return self._current_log_file
     
+    def _ensure_log_fd(self) -> int:
+        """
+        Ensure an append descriptor is open on the current log file.
+        
+        Reopens after daily rotation, or if the file was deleted or moved
+        away under the logger (so events never go to an unlinked inode).
+        
+        Returns:
+            File descriptor opened with O_APPEND
+        """
+        log_file = self._ensure_log_file()
+        if self._fd is not None and os.fstat(self._fd).st_nlink == 0:
+            self._close_fd()
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+            self._fd = os.open(log_file, flags, 0o666)
+        return self._fd
+    
+    def _close_fd(self):
+        """Close the current log descriptor, if any."""
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            os.close(fd)
+    
+    def close(self):
+        """Close the log file descriptor (reopened by the next log call)."""
+        with self._lock:
+            self._close_fd()
+    
+    def __del__(self):
+        try:
+            self._close_fd()
+        except Exception:
+            pass
+    
     def log(self, event: Dict[str, Any]):
         """
         Write a log event to JSONL file.
@@ -81,47 +122,21 @@ class JSONLLogger:
         Args:
             event: Dictionary containing log event data
         """
+        # Add timestamp if not present
+        if "timestamp" not in event:
+            event["timestamp"] = datetime.utcnow().isoformat()
+        
+        # Serialize outside the lock; the line is appended with a single
+        # write() so concurrent writers never interleave partial lines
+        payload = (_ENCODER.encode(event) + "\n").encode("utf-8")
+        
         with self._lock:
-            log_file = self._ensure_log_file()
-            
-            # Add timestamp if not present
-            if "timestamp" not in event:
-                event["timestamp"] = datetime.utcnow().isoformat()
-            
-            # Write to temporary file first (atomic write)
-            tmp_file = log_file.with_suffix(".jsonl.tmp")
-            
             try:
-                # Read existing content if file exists
-                existing_content = ""
-                if log_file.exists():
-                    try:
-                        with open(log_file, "r", encoding="utf-8") as f:
-                            existing_content = f.read()
-                    except Exception:
-                        # If read fails, start fresh
-                        existing_content = ""
-                
-                # Write to temporary file
-                with open(tmp_file, "w", encoding="utf-8") as f:
-                    # Write existing content
-                    if existing_content:
-                        f.write(existing_content)
-                    
-                    # Write new log entry
-                    json_line = json.dumps(event, ensure_ascii=False)
-                    f.write(json_line + "\n")
-                
-                # Atomic rename
-                tmp_file.replace(log_file)
-                
+                fd = self._ensure_log_fd()
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
             except Exception as e:
-                # Clean up tmp file on error
-                if tmp_file.exists():
-                    try:
-                        tmp_file.unlink()
-                    except Exception:
-                        pass
                 # Re-raise to allow caller to handle
                 raise RuntimeError(f"Failed to write log entry: {e}") from e
     
@@ -267,6 +282,39 @@ class JSONLLogger:
         
         self.log(event)
     
+    def log_file_stabilized(self,
+                            run_id: Optional[str],
+                            source_path: str,
+                            dest_path: str,
+                            metadata: Dict[str, Any],
+                            stability_seconds: float):
+        """
+        Log file stabilized event (input file stable and copied to work dir).
+        
+        Args:
+            run_id: Run ID
+            source_path: Source file path (sync folder)
+            dest_path: Copied file path (work directory)
+            metadata: Stabilization metadata from FileStabilizer.wait_for_stable
+            stability_seconds: Configured stability window
+        """
+        event = {
+            "event_type": "file_stabilized",
+            "timestamp": datetime.utcnow().isoformat(),
+            "run_id": run_id,
+            "source_path": source_path,
+            "dest_path": dest_path,
+            "initial_size": metadata["initial_size"],
+            "initial_mtime": metadata["initial_mtime"],
+            "final_size": metadata["final_size"],
+            "final_mtime": metadata["final_mtime"],
+            "wait_duration_seconds": metadata["wait_duration_seconds"],
+            "stable_duration_seconds": metadata["stable_duration_seconds"],
+            "change_count": metadata["change_count"],
+            "stability_seconds": stability_seconds
+        }
+        self.log(event)
+    
     def log_error(self,
                  run_id: str,
                  error_type: str,
@@ -6,9 +6,13 @@ Uses xlsxwriter with constant_memory=True to handle large datasets.
 """
 
 import json
+import os
 import yaml
+from contextlib import suppress
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 import xlsxwriter
 from xlsxwriter.utility import xl_rowcol_to_cell, xl_range
@@ -22,7 +26,7 @@ class ExcelWriter:
     - constant_memory=True for large datasets
     - Multiple sheets (summary, findings, audit narrative)
     - Charts and graphs
-    - Chunked data writing (1,000 rows at a time)
+    - Chunked data writing (10,000 rows at a time)
     """
     
     def __init__(self, output_path: Path, template_spec_path: Optional[Path] = None):
@@ -36,6 +40,9 @@ class ExcelWriter:
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # The workbook is written next to output_path and renamed into place by close()
+        self.tmp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        
         # Load template spec if provided
         if template_spec_path is None:
             template_spec_path = Path(__file__).parent.parent.parent / "report" / "excel_template_spec.json"
@@ -47,7 +54,7 @@ class ExcelWriter:
         
         # Create workbook with constant_memory=True (required for large datasets)
         self.workbook = xlsxwriter.Workbook(
-            str(self.output_path),
+            str(self.tmp_path),
             {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss'}
         )
         
@@ -57,6 +64,29 @@ class ExcelWriter:
         # Track sheet references
         self.sheets: Dict[str, Any] = {}
     
+    def close(self) -> Path:
+        """
+        Close the workbook and atomically move it to output_path.
+        
+        os.replace renames the .tmp file on the same filesystem, so no bytes
+        are copied. On failure the partial .tmp file is removed. Calling
+        close() again after success is a no-op.
+        
+        Returns:
+            Path to the Excel file
+        """
+        if self.workbook.fileclosed:
+            return self.output_path
+        
+        try:
+            self.workbook.close()
+            os.replace(self.tmp_path, self.output_path)
+        except BaseException:
+            self.tmp_path.unlink(missing_ok=True)
+            raise
+        
+        return self.output_path
+    
     def _create_formats(self) -> Dict[str, xlsxwriter.format.Format]:
         """Create cell formats based on template spec."""
         formats = {}
@@ -149,6 +179,30 @@ class ExcelWriter:
         
         return formats
     
+    def _format_for(self, format_key: Optional[str]) -> xlsxwriter.format.Format:
+        """
+        Resolve a format key to one of the formats created in __init__.
+        
+        Never calls workbook.add_format: xlsxwriter keeps every Format it is
+        given, so creating formats per cell/row grows memory with row count.
+        Unknown or empty keys fall back to the data format.
+        """
+        if not format_key:
+            return self.formats['data']
+        return self.formats.get(format_key, self.formats['data'])
+    
+    def _value_format(self, value: Any, base_format: xlsxwriter.format.Format,
+                      is_risk: bool, is_usage_type: bool) -> xlsxwriter.format.Format:
+        """Pick the conditional format for a risk/usage_type cell value."""
+        if isinstance(value, str):
+            if is_risk and value.lower() == 'high':
+                return self.formats['high_risk']
+            if is_risk and value.lower() == 'medium':
+                return self.formats['medium_risk']
+            if is_usage_type and value == 'genai':
+                return self.formats['genai']
+        return base_format
+    
     def add_sheet(self, name: str, description: Optional[str] = None) -> Any:
         """Add a new worksheet."""
         sheet = self.workbook.add_worksheet(name)
@@ -171,64 +225,153 @@ class ExcelWriter:
         Returns:
             Next row number
         """
-        for col_idx, col_name in enumerate(columns):
-            sheet.write(row, start_col + col_idx, col_name, self.formats['header'])
+        sheet.write_row(row, start_col, columns, self.formats['header'])
         
         return row + 1
     
     def write_table_data_chunked(self, sheet: Any, 
-                                 row: int, columns: List[str], data: List[Dict[str, Any]],
+                                 row: int, columns: List[str],
+                                 data: Iterable[Union[Dict[str, Any], Sequence[Any]]],
                                  start_col: int = 0, max_rows: Optional[int] = None,
-                                 column_formats: Optional[Dict[str, str]] = None) -> int:
+                                 column_formats: Optional[Dict[str, str]] = None,
+                                 flush_every: int = 10_000) -> int:
         """
         Write table data in chunks (for constant memory mode).
         
+        Rows are streamed from the iterable (never sliced into a list). Dict
+        rows are projected to column-ordered tuples with one precompiled
+        itemgetter per call; conditional formats are resolved column-wise per
+        chunk and cells are addressed by index. Adjacent columns sharing a
+        static format are written with one write_row call; only
+        value-dependent (risk/usage_type) cells are written individually. Rows
+        may be dicts keyed by column name or sequences already in column order
+        (e.g. from _iter_rows).
+        
         Args:
             sheet: Worksheet to write to
             row: Starting row
             columns: Column names
-            data: List of row dictionaries
+            data: Iterable of row dictionaries or column-ordered sequences
             start_col: Starting column index
             max_rows: Maximum rows to write (None = all)
             column_formats: Dict mapping column names to format keys
+            flush_every: Rows pulled from the iterable per chunk; bounds the
+                Python-side buffer (xlsxwriter constant_memory flushes each
+                completed row to its temp file on its own)
         
         Returns:
             Next row number
         """
+        rows = iter(data)
         if max_rows is not None:
-            data = data[:max_rows]
+            rows = islice(rows, max_rows)
+        
+        # Resolve formats once per column (not per cell)
+        column_formats = column_formats or {}
+        col_formats = [self._format_for(column_formats.get(col_name)) for col_name in columns]
+        
+        # Columns whose format depends on the cell value
+        risk_cols = {i for i, c in enumerate(columns) if 'risk' in c.lower()}
+        usage_type_cols = {i for i, c in enumerate(columns) if 'usage_type' in c.lower()}
+        
+        # Split columns into runs sharing one static format (one write_row call
+        # each) and single value-dependent cells: (start, end, format, conditional)
+        segments = []
+        for col_idx, cell_format in enumerate(col_formats):
+            conditional = col_idx in risk_cols or col_idx in usage_type_cols
+            if (segments and not conditional and not segments[-1][3]
+                    and segments[-1][2] is cell_format):
+                segments[-1] = (segments[-1][0], col_idx + 1, cell_format, False)
+            else:
+                segments.append((col_idx, col_idx + 1, cell_format, conditional))
+        
+        # Column-name -> position projection for dict rows, built once
+        getter = itemgetter(*columns) if columns else None
         
-        chunk_size = 1000
         current_row = row
         
-        for chunk_start in range(0, len(data), chunk_size):
-            chunk = data[chunk_start:chunk_start + chunk_size]
+        while True:
+            chunk = list(islice(rows, flush_every))
+            if not chunk:
+                break
             
-            for row_data in chunk:
-                for col_idx, col_name in enumerate(columns):
-                    value = row_data.get(col_name)
-                    format_key = None
-                    
-                    if column_formats and col_name in column_formats:
-                        format_key = column_formats[col_name]
-                    
-                    cell_format = self.formats.get(format_key, self.formats['data']) if format_key else self.formats['data']
-                    
-                    # Apply conditional formatting based on value
-                    if isinstance(value, str):
-                        if 'risk' in col_name.lower() and value.lower() == 'high':
-                            cell_format = self.formats['high_risk']
-                        elif 'risk' in col_name.lower() and value.lower() == 'medium':
-                            cell_format = self.formats['medium_risk']
-                        elif 'usage_type' in col_name.lower() and value == 'genai':
-                            cell_format = self.formats['genai']
-                    
-                    sheet.write(current_row, start_col + col_idx, value, cell_format)
+            if isinstance(chunk[0], dict):
+                chunk = self._project_dict_rows(chunk, columns, getter)
+            
+            # Value-dependent formats are resolved column-wise (SoA), by row index
+            cell_formats = {}
+            for start, _, cell_format, conditional in segments:
+                if conditional:
+                    values = [r[start] for r in chunk]
+                    cell_formats[start] = [
+                        self._value_format(value, cell_format, start in risk_cols, start in usage_type_cols)
+                        for value in values
+                    ]
+            
+            for r, values in enumerate(chunk):
+                for start, end, cell_format, conditional in segments:
+                    if conditional:
+                        sheet.write(current_row, start_col + start, values[start], cell_formats[start][r])
+                    else:
+                        sheet.write_row(current_row, start_col + start, values[start:end], cell_format)
                 
                 current_row += 1
         
         return current_row
     
+    @staticmethod
+    def _project_dict_rows(chunk: List[Dict[str, Any]], columns: List[str],
+                           getter: Optional[itemgetter]) -> List[Sequence[Any]]:
+        """
+        Project dict rows to column-ordered tuples.
+        
+        Uses the precompiled itemgetter (C-level lookups); a row missing a
+        column falls back to dict.get so missing keys still read as None.
+        """
+        if getter is None:
+            return [()] * len(chunk)
+        try:
+            if len(columns) == 1:
+                # itemgetter with one key returns the bare value
+                return [(value,) for value in map(getter, chunk)]
+            return list(map(getter, chunk))
+        except KeyError:
+            return [tuple(row_data.get(col_name) for col_name in columns) for row_data in chunk]
+    
+    def _collect_parquet_files(self, vendor: str) -> List[str]:
+        """
+        List processed Parquet files for a vendor.
+        
+        Parquet files are in data/processed/vendor=<v>/date=<YYYY-MM-DD>/.
+        """
+        processed_dir = Path(__file__).parent.parent.parent / "data" / "processed"
+        vendor_dir = processed_dir / f"vendor={vendor}"
+        
+        parquet_files = []
+        if vendor_dir.exists():
+            for date_dir in vendor_dir.iterdir():
+                if date_dir.is_dir() and date_dir.name.startswith("date="):
+                    for parquet_file in date_dir.glob("*.parquet"):
+                        parquet_files.append(str(parquet_file))
+        return parquet_files
+    
+    def _iter_rows(self, db_reader, query: str, params: Optional[List[Any]] = None,
+                   batch_size: int = 10_000) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream query results as row tuples via Arrow record batches.
+        
+        Values are converted column-by-column per batch, so no full fetchall()
+        result is held in memory. The query runs on its own cursor, which is
+        closed once the rows are consumed (or the generator is closed), so a
+        sheet's result set is released before the next sheet and before
+        workbook.close() serializes the XML.
+        """
+        from db.duckdb_client import iter_arrow_rows
+        
+        with db_reader.cursor() as cursor:
+            cursor.execute(query, params or [])
+            yield from iter_arrow_rows(cursor, batch_size)
+    
     def create_chart(self, chart_type: str, name: str, data_range: str,
                     categories_range: Optional[str] = None,
                     title: Optional[str] = None) -> Any:
@@ -275,43 +418,48 @@ class ExcelWriter:
         Returns:
             Path to generated Excel file
         """
-        # 1. Executive Summary
-        self._create_executive_summary(report_data, db_reader, run_id)
-        
-        # 2. Top Shadow AI Apps
-        self._create_shadow_ai_sheet(report_data, db_reader, run_id)
-        
-        # 3. High Risk Users
-        self._create_high_risk_users_sheet(report_data, db_reader, run_id)
-        
-        # 4. Findings A (High-Volume)
-        self._create_findings_a_sheet(report_data, db_reader, run_id)
-        
-        # 5. Findings B (High-Risk Small)
-        self._create_findings_b_sheet(report_data, db_reader, run_id)
-        
-        # 6. Findings C (Coverage Sample)
-        self._create_findings_c_sheet(report_data, db_reader, run_id)
-        
-        # 7. Department Risk
-        self._create_department_risk_sheet(report_data, db_reader, run_id)
-        
-        # 8. Time Series
-        self._create_time_series_sheet(report_data, db_reader, run_id)
-        
-        # 9. Audit Narrative (MUST HAVE)
-        self._create_audit_narrative_sheet(report_data, run_context, db_reader, run_id)
-        
-        # 10. Policy Gaps
-        self._create_policy_gaps_sheet(report_data, db_reader, run_id)
-        
-        # 11. Cost Reduction Simulation (Tier1商品要件)
-        self._create_cost_reduction_sheet(report_data, db_reader, run_id)
-        
-        # Close workbook
-        self.workbook.close()
-        
-        return self.output_path
+        try:
+            # 1. Executive Summary
+            self._create_executive_summary(report_data, db_reader, run_id)
+            
+            # 2. Top Shadow AI Apps
+            self._create_shadow_ai_sheet(report_data, db_reader, run_id)
+            
+            # 3. High Risk Users
+            self._create_high_risk_users_sheet(report_data, db_reader, run_id)
+            
+            # 4. Findings A (High-Volume)
+            self._create_findings_a_sheet(report_data, db_reader, run_id)
+            
+            # 5. Findings B (High-Risk Small)
+            self._create_findings_b_sheet(report_data, db_reader, run_id)
+            
+            # 6. Findings C (Coverage Sample)
+            self._create_findings_c_sheet(report_data, db_reader, run_id)
+            
+            # 7. Department Risk
+            self._create_department_risk_sheet(report_data, db_reader, run_id)
+            
+            # 8. Time Series
+            self._create_time_series_sheet(report_data, db_reader, run_id)
+            
+            # 9. Audit Narrative (MUST HAVE)
+            self._create_audit_narrative_sheet(report_data, run_context, db_reader, run_id)
+            
+            # 10. Policy Gaps
+            self._create_policy_gaps_sheet(report_data, db_reader, run_id)
+            
+            # 11. Cost Reduction Simulation (Tier1商品要件)
+            self._create_cost_reduction_sheet(report_data, db_reader, run_id)
+        except BaseException:
+            # Finalize into the .tmp file only to release constant_memory temp
+            # files, then drop it: a partial report never reaches output_path
+            with suppress(Exception):
+                self.workbook.close()
+            self.tmp_path.unlink(missing_ok=True)
+            raise
+        
+        return self.close()
     
     def _create_executive_summary(self, report_data: Dict[str, Any], 
                                  db_reader, run_id: str):
@@ -371,26 +519,27 @@ class ExcelWriter:
         LIMIT 10
         """
         
-        result = db_reader.execute(query, [run_id]).fetchall()
-        
         columns = ["Rank", "Service", "Category", "Risk", "UniqueUsers", 
                   "AccessCount", "BytesSent", "FirstSeen", "LastSeen"]
         row = self.write_table_header(sheet, row, columns)
         
-        data = []
-        for rank, (service_name, category, risk_level, unique_users, access_count,
-                  bytes_sent_total, first_seen, last_seen) in enumerate(result, 1):
-            data.append({
-                "Rank": rank,
-                "Service": service_name or "Unknown",
-                "Category": category or "",
-                "Risk": risk_level or "unknown",
-                "UniqueUsers": unique_users or 0,
-                "AccessCount": access_count or 0,
-                "BytesSent": bytes_sent_total or 0,
-                "FirstSeen": first_seen.strftime("%Y-%m-%d %H:%M:%S") if first_seen else "",
-                "LastSeen": last_seen.strftime("%Y-%m-%d %H:%M:%S") if last_seen else ""
-            })
+        # Positional rows in column order (streamed, no intermediate dicts)
+        data = (
+            (
+                rank,
+                service_name or "Unknown",
+                category or "",
+                risk_level or "unknown",
+                unique_users or 0,
+                access_count or 0,
+                bytes_sent_total or 0,
+                first_seen.strftime("%Y-%m-%d %H:%M:%S") if first_seen else "",
+                last_seen.strftime("%Y-%m-%d %H:%M:%S") if last_seen else ""
+            )
+            for rank, (service_name, category, risk_level, unique_users, access_count,
+                       bytes_sent_total, first_seen, last_seen)
+            in enumerate(self._iter_rows(db_reader, query, [run_id]), 1)
+        )
         
         column_formats = {
             "BytesSent": "bytes",
@@ -426,26 +575,25 @@ class ExcelWriter:
         LIMIT 10
         """
         
-        result = db_reader.execute(query, [run_id]).fetchall()
-        
         columns = ["Rank", "UserID", "Department", "TotalBytesSent",
                   "HighRiskDestinations", "GenAIAccess", "BurstCount", "RiskScore"]
         row = self.write_table_header(sheet, row, columns)
         
         # Note: This is a simplified version. Full implementation would require
         # user-level aggregation from canonical events
-        data = []
-        for rank, row_data in enumerate(result, 1):
-            data.append({
-                "Rank": rank,
-                "UserID": "N/A",  # Would need user_id from events
-                "Department": "",
-                "TotalBytesSent": row_data[2] or 0,
-                "HighRiskDestinations": 0,
-                "GenAIAccess": 1 if row_data[5] == 'genai' else 0,
-                "BurstCount": row_data[3] or 0,
-                "RiskScore": 0.0
-            })
+        data = (
+            (
+                rank,
+                "N/A",  # Would need user_id from events
+                "",
+                row_data[2] or 0,
+                0,
+                1 if row_data[5] == 'genai' else 0,
+                row_data[3] or 0,
+                0.0
+            )
+            for rank, row_data in enumerate(self._iter_rows(db_reader, query, [run_id]), 1)
+        )
         
         column_formats = {"TotalBytesSent": "bytes"}
         self.write_table_data_chunked(sheet, row, columns, data,
@@ -477,35 +625,34 @@ class ExcelWriter:
         LIMIT 1000
         """
         
-        result = db_reader.execute(query, [run_id]).fetchall()
-        
         columns = ["Timestamp", "UserID", "DestDomain", "Service", "Category",
                   "Risk", "BytesSent", "Method", "Action"]
         row = self.write_table_header(sheet, row, columns)
         
-        data = []
-        for row_data in result:
-            data.append({
-                "Timestamp": "",
-                "UserID": "",
-                "DestDomain": row_data[2] or "",
-                "Service": row_data[5] or "Unknown",
-                "Category": row_data[6] or "",
-                "Risk": row_data[7] or "unknown",
-                "BytesSent": row_data[3] or 0,
-                "Method": "",
-                "Action": ""
-            })
+        data = (
+            (
+                "",
+                "",
+                row_data[2] or "",
+                row_data[5] or "Unknown",
+                row_data[6] or "",
+                row_data[7] or "unknown",
+                row_data[3] or 0,
+                "",
+                ""
+            )
+            for row_data in self._iter_rows(db_reader, query, [run_id])
+        )
+        
+        column_formats = {"BytesSent": "bytes"}
+        next_row = self.write_table_data_chunked(sheet, row, columns, data,
+                                                 max_rows=1000, column_formats=column_formats)
         
-        if len(result) >= 1000:
-            # Add overflow note
-            sheet.write(row + len(data), 0, 
+        if next_row - row >= 1000:
+            # Add overflow note (after the data: constant_memory cannot go back to earlier rows)
+            sheet.write(next_row, 0, 
                        f"Note: Full data available in Parquet export (showing first 1,000 rows)",
                        self.formats['data'])
-        
-        column_formats = {"BytesSent": "bytes"}
-        self.write_table_data_chunked(sheet, row, columns, data,
-                                      max_rows=1000, column_formats=column_formats)
     
     def _create_findings_b_sheet(self, report_data: Dict[str, Any],
                                  db_reader, run_id: str):
@@ -533,35 +680,33 @@ class ExcelWriter:
         LIMIT 1000
         """
         
-        result = db_reader.execute(query, [run_id]).fetchall()
-        
         columns = ["Timestamp", "UserID", "DestDomain", "Service", "Category",
                   "Risk", "BytesSent", "TriggerType", "Action"]
         row = self.write_table_header(sheet, row, columns)
         
-        data = []
-        for row_data in result:
-            trigger_type = "Burst" if row_data[5] and row_data[5] > 0 else "Cumulative"
-            data.append({
-                "Timestamp": "",
-                "UserID": "",
-                "DestDomain": row_data[2] or "",
-                "Service": row_data[6] or "Unknown",
-                "Category": row_data[7] or "",
-                "Risk": row_data[8] or "unknown",
-                "BytesSent": row_data[3] or 0,
-                "TriggerType": trigger_type,
-                "Action": ""
-            })
+        data = (
+            (
+                "",
+                "",
+                row_data[2] or "",
+                row_data[6] or "Unknown",
+                row_data[7] or "",
+                row_data[8] or "unknown",
+                row_data[3] or 0,
+                "Burst" if row_data[5] and row_data[5] > 0 else "Cumulative",
+                ""
+            )
+            for row_data in self._iter_rows(db_reader, query, [run_id])
+        )
         
-        if len(result) >= 1000:
-            sheet.write(row + len(data), 0,
+        column_formats = {"BytesSent": "bytes"}
+        next_row = self.write_table_data_chunked(sheet, row, columns, data,
+                                                 max_rows=1000, column_formats=column_formats)
+        
+        if next_row - row >= 1000:
+            sheet.write(next_row, 0,
                        f"Note: Full data available in Parquet export (showing first 1,000 rows)",
                        self.formats['data'])
-        
-        column_formats = {"BytesSent": "bytes"}
-        self.write_table_data_chunked(sheet, row, columns, data,
-                                      max_rows=1000, column_formats=column_formats)
     
     def _create_findings_c_sheet(self, report_data: Dict[str, Any],
                                 db_reader, run_id: str):
@@ -588,23 +733,22 @@ class ExcelWriter:
         LIMIT 500
         """
         
-        result = db_reader.execute(query, [run_id]).fetchall()
-        
         columns = ["Timestamp", "UserID", "DestDomain", "Service", "Category",
                   "Risk", "BytesSent"]
         row = self.write_table_header(sheet, row, columns)
         
-        data = []
-        for row_data in result:
-            data.append({
-                "Timestamp": "",
-                "UserID": "",
-                "DestDomain": row_data[2] or "",
-                "Service": row_data[5] or "Unknown",
-                "Category": row_data[6] or "",
-                "Risk": row_data[7] or "unknown",
-                "BytesSent": row_data[3] or 0
-            })
+        data = (
+            (
+                "",
+                "",
+                row_data[2] or "",
+                row_data[5] or "Unknown",
+                row_data[6] or "",
+                row_data[7] or "unknown",
+                row_data[3] or 0
+            )
+            for row_data in self._iter_rows(db_reader, query, [run_id])
+        )
         
         column_formats = {"BytesSent": "bytes"}
         self.write_table_data_chunked(sheet, row, columns, data,
@@ -642,18 +786,8 @@ class ExcelWriter:
                                           column_formats=column_formats)
             return
         
-        # Find Parquet files for this run_id and vendor
-        # Parquet files are in data/processed/vendor=<v>/date=<YYYY-MM-DD>/
-        processed_dir = Path(__file__).parent.parent.parent / "data" / "processed"
-        vendor_dir = processed_dir / f"vendor={vendor}"
-        
-        # Collect all Parquet files for this vendor
-        parquet_files = []
-        if vendor_dir.exists():
-            for date_dir in vendor_dir.iterdir():
-                if date_dir.is_dir() and date_dir.name.startswith("date="):
-                    for parquet_file in date_dir.glob("*.parquet"):
-                        parquet_files.append(str(parquet_file))
+        # Find Parquet files for this vendor
+        parquet_files = self._collect_parquet_files(vendor)
         
         if not parquet_files:
             # No Parquet files found - use placeholder
@@ -678,18 +812,15 @@ class ExcelWriter:
         # Join with signature_stats and analysis_cache to get risk information
         try:
             # Create a CTE to read Parquet files
-            # DuckDB read_parquet accepts array of file paths
-            # Escape single quotes in paths and build array string
-            escaped_paths = [p.replace("'", "''") for p in parquet_files]
-            parquet_paths_str = "', '".join(escaped_paths)
-            
-            query = f"""
+            # The file list is bound as a LIST parameter (no path escaping needed);
+            # all aggregation stays in DuckDB, only per-department rows come back
+            query = """
             WITH events AS (
                 SELECT 
                     user_dept,
                     user_id,
                     url_signature
-                FROM read_parquet(['{parquet_paths_str}'])
+                FROM read_parquet(?)
                 WHERE user_dept IS NOT NULL AND user_dept != ''
             ),
             dept_stats AS (
@@ -732,19 +863,20 @@ class ExcelWriter:
             ORDER BY avg_risk_score DESC, total_events DESC
             """
             
-            result = db_reader.execute(query, [run_id]).fetchall()
-            
-            data = []
-            for row_data in result:
-                dept, user_count, total_events, high_risk_pct, genai_pct, avg_risk_score = row_data
-                data.append({
-                    "Department": dept or "Unknown",
-                    "UserCount": user_count or 0,
-                    "TotalEvents": total_events or 0,
-                    "HighRiskPct": high_risk_pct or 0.0,
-                    "GenAIPct": genai_pct or 0.0,
-                    "AvgRiskScore": avg_risk_score or 0.0
-                })
+            # One row per department: read it all inside the try so any query
+            # or batch error maps to the placeholder below
+            data = [
+                (
+                    dept or "Unknown",
+                    user_count or 0,
+                    total_events or 0,
+                    high_risk_pct or 0.0,
+                    genai_pct or 0.0,
+                    avg_risk_score or 0.0
+                )
+                for dept, user_count, total_events, high_risk_pct, genai_pct, avg_risk_score
+                in self._iter_rows(db_reader, query, [parquet_files, run_id])
+            ]
             
             if not data:
                 # No data found - use placeholder
@@ -803,17 +935,8 @@ class ExcelWriter:
                                           column_formats=column_formats)
             return
         
-        # Find Parquet files for this run_id and vendor
-        processed_dir = Path(__file__).parent.parent.parent / "data" / "processed"
-        vendor_dir = processed_dir / f"vendor={vendor}"
-        
-        # Collect all Parquet files for this vendor
-        parquet_files = []
-        if vendor_dir.exists():
-            for date_dir in vendor_dir.iterdir():
-                if date_dir.is_dir() and date_dir.name.startswith("date="):
-                    for parquet_file in date_dir.glob("*.parquet"):
-                        parquet_files.append(str(parquet_file))
+        # Find Parquet files for this vendor
+        parquet_files = self._collect_parquet_files(vendor)
         
         if not parquet_files:
             # No Parquet files found
@@ -830,18 +953,14 @@ class ExcelWriter:
         # Query time series from Parquet files using DuckDB
         # Aggregate by week (ISO week: year-week)
         try:
-            # Escape single quotes in paths and build array string
-            escaped_paths = [p.replace("'", "''") for p in parquet_files]
-            parquet_paths_str = "', '".join(escaped_paths)
-            
             # Phase 15: Add monthly aggregation in addition to weekly
-            query = f"""
+            query = """
             WITH events AS (
                 SELECT 
                     event_time,
                     url_signature,
                     action
-                FROM read_parquet(['{parquet_paths_str}'])
+                FROM read_parquet(?)
             ),
             events_with_time AS (
                 SELECT 
@@ -957,26 +1076,21 @@ class ExcelWriter:
             ORDER BY period_type, period ASC
             """
             
-            result = db_reader.execute(query, [run_id, run_id]).fetchall()
-            
-            data = []
-            for row_data in result:
-                period, period_type, total_events, unknown_pct, genai_pct, high_risk_pct, blocked_pct = row_data
-                # Format period based on type
-                if period_type == "Week":
-                    period_str = str(period) if period else "N/A"
-                else:  # Month
-                    period_str = str(period) if period else "N/A"
-                
-                data.append({
-                    "Period": period_str,
-                    "PeriodType": period_type or "N/A",
-                    "TotalEvents": total_events or 0,
-                    "UnknownPct": unknown_pct or 0.0,
-                    "GenAIPct": genai_pct or 0.0,
-                    "HighRiskPct": high_risk_pct or 0.0,
-                    "BlockedPct": blocked_pct or 0.0
-                })
+            # One row per week/month: read it all inside the try so any query
+            # or batch error falls back to empty data
+            data = [
+                (
+                    str(period) if period else "N/A",
+                    period_type or "N/A",
+                    total_events or 0,
+                    unknown_pct or 0.0,
+                    genai_pct or 0.0,
+                    high_risk_pct or 0.0,
+                    blocked_pct or 0.0
+                )
+                for period, period_type, total_events, unknown_pct, genai_pct, high_risk_pct, blocked_pct
+                in self._iter_rows(db_reader, query, [parquet_files, run_id, run_id])
+            ]
         
         except Exception as e:
             # On error, log and use empty data
@@ -1356,17 +1470,8 @@ This report is audit-ready and includes all required metadata for reproducibilit
             sheet.write(row, 0, "N/A (vendor not found)", self.formats['data'])
             return
         
-        # Find Parquet files for this run_id and vendor
-        processed_dir = Path(__file__).parent.parent.parent / "data" / "processed"
-        vendor_dir = processed_dir / f"vendor={vendor}"
-        
-        # Collect all Parquet files for this vendor
-        parquet_files = []
-        if vendor_dir.exists():
-            for date_dir in vendor_dir.iterdir():
-                if date_dir.is_dir() and date_dir.name.startswith("date="):
-                    for parquet_file in date_dir.glob("*.parquet"):
-                        parquet_files.append(str(parquet_file))
+        # Find Parquet files for this vendor
+        parquet_files = self._collect_parquet_files(vendor)
         
         if not parquet_files:
             # No Parquet files found
@@ -1375,19 +1480,15 @@ This report is audit-ready and includes all required metadata for reproducibilit
         
         # Query user/department AI app usage from Parquet files
         try:
-            # Escape single quotes in paths and build array string
-            escaped_paths = [p.replace("'", "''") for p in parquet_files]
-            parquet_paths_str = "', '".join(escaped_paths)
-            
             # Query user/department usage statistics
-            query = f"""
+            query = """
             WITH events AS (
                 SELECT 
                     user_id,
                     COALESCE(user_dept, 'Unknown') as user_dept,
                     url_signature,
                     event_time
-                FROM read_parquet(['{parquet_paths_str}'])
+                FROM read_parquet(?)
                 WHERE user_id IS NOT NULL AND user_id != ''
             ),
             usage_stats AS (
@@ -1428,13 +1529,11 @@ This report is audit-ready and includes all required metadata for reproducibilit
             ORDER BY user_dept, user_id, service_name
             """
             
-            result = db_reader.execute(query, [run_id]).fetchall()
-            
             # Aggregate data for cost calculation
             user_service_map: Dict[Tuple[str, str], Dict[str, Any]] = {}
             dept_service_map: Dict[Tuple[str, str], Dict[str, Any]] = {}
             
-            for row_data in result:
+            for row_data in self._iter_rows(db_reader, query, [parquet_files, run_id]):
                 dept, user_id, service_name, total_accesses, first_access, last_access = row_data
                 service_name = service_name or "Unknown"
                 
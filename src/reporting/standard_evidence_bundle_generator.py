@@ -33,6 +33,7 @@ Bundle structure (v0.1 root structure):
         └── chain.json            # Hash chain (covers manifest.json, objects/index.json)
 """
 
+import os
 import json
 import hashlib
 import uuid
@@ -40,6 +41,21 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, date
 from dataclasses import dataclass, asdict
+from functools import cached_property
+
+
+def is_fast_hash_enabled() -> bool:
+    """
+    Check if fast checksums are enabled via environment variable.
+    
+    When AIMO_FAST_HASH=1, checksums.json is computed with BLAKE2b-256
+    (same 64-hex length) instead of SHA-256. Intended for test runs only;
+    payload_index and hash_chain always use SHA-256.
+    
+    Returns:
+        True if AIMO_FAST_HASH is set
+    """
+    return os.getenv("AIMO_FAST_HASH", "").lower() in ("1", "true", "yes")
 
 
 @dataclass
@@ -50,9 +66,30 @@ class BundleGenerationResult:
     evidence_pack_manifest_path: Path
     checksums_path: Path
     validation_result_path: Path
-    validation_passed: bool
+    validation_passed: Optional[bool]  # None when validation was skipped
     validation_errors: List[str]
     files_generated: List[str]
+    
+    # v0.1 layout paths (derived from bundle_path)
+    @cached_property
+    def payloads_dir(self) -> Path:
+        return self.bundle_path / "payloads"
+    
+    @cached_property
+    def logs_dir(self) -> Path:
+        return self.payloads_dir / "logs"
+    
+    @cached_property
+    def derived_dir(self) -> Path:
+        return self.payloads_dir / "derived"
+    
+    @cached_property
+    def shadow_ai_log_path(self) -> Path:
+        return self.logs_dir / StandardEvidenceBundleGenerator.SHADOW_AI_DISCOVERY_LOG
+    
+    @cached_property
+    def objects_index_path(self) -> Path:
+        return self.bundle_path / "objects" / "index.json"
 
 
 class StandardEvidenceBundleGenerator:
@@ -109,7 +146,8 @@ class StandardEvidenceBundleGenerator:
         run_context,
         output_dir: Path,
         db_reader,
-        include_derived: bool = True
+        include_derived: bool = True,
+        include_validation: bool = True
     ) -> BundleGenerationResult:
         """
         Generate a complete Evidence Bundle.
@@ -119,6 +157,9 @@ class StandardEvidenceBundleGenerator:
             output_dir: Output directory for the bundle
             db_reader: DuckDB reader connection
             include_derived: Whether to include derived (legacy) outputs
+            include_validation: Whether to run Standard validation. When False,
+                validation_result.json is still written but marked "skipped"
+                (passed=None); use only where the validation outcome is not needed.
         
         Returns:
             BundleGenerationResult with paths and validation status
@@ -216,7 +257,10 @@ class StandardEvidenceBundleGenerator:
         )
         
         # 12. Run validation (validator expects root manifest.json)
-        validation_passed, validation_errors = self._run_validation(bundle_dir)
+        if include_validation:
+            validation_passed, validation_errors = self._run_validation(bundle_dir)
+        else:
+            validation_passed, validation_errors = None, []
         
         # 13. validation_result.json under payloads/
         validation_result_path = self._generate_validation_result(
@@ -489,10 +533,12 @@ class StandardEvidenceBundleGenerator:
         ORDER BY ss.bytes_sent_sum DESC
         """
         
-        rows = db_reader.execute(query, [run_id]).fetchall()
-        
         # Import compatibility layer
         from db.compat import normalize_taxonomy_record
+        from db.duckdb_client import iter_arrow_rows
+        
+        # Stream Arrow record batches (converted column-wise to row tuples)
+        rows = iter_arrow_rows(db_reader.execute(query, [run_id]))
         
         results = []
         for row in rows:
@@ -871,9 +917,10 @@ class StandardEvidenceBundleGenerator:
         bundle_dir: Path,
         files: List[str]
     ) -> Path:
-        """Generate SHA-256 checksums for all files."""
+        """Generate SHA-256 checksums for all files (BLAKE2b-256 if AIMO_FAST_HASH)."""
+        fast_hash = is_fast_hash_enabled()
         checksums = {
-            "algorithm": "SHA-256",
+            "algorithm": "BLAKE2b-256" if fast_hash else "SHA-256",
             "generated_at": datetime.utcnow().isoformat(),
             "files": {}
         }
@@ -881,8 +928,11 @@ class StandardEvidenceBundleGenerator:
         for file_rel_path in files:
             file_path = bundle_dir / file_rel_path
             if file_path.exists():
-                sha256_hash = self._calculate_file_sha256(file_path)
-                checksums["files"][file_rel_path] = sha256_hash
+                if fast_hash:
+                    checksum = self._calculate_file_blake2b(file_path)
+                else:
+                    checksum = self._calculate_file_sha256(file_path)
+                checksums["files"][file_rel_path] = checksum
         
         checksums_path = bundle_dir / "checksums.json"
         self._write_json_atomic(checksums_path, checksums)
@@ -937,14 +987,18 @@ class StandardEvidenceBundleGenerator:
     def _generate_validation_result(
         self,
         bundle_dir: Path,
-        passed: bool,
+        passed: Optional[bool],
         errors: List[str]
     ) -> Path:
-        """Generate validation_result.json."""
+        """Generate validation_result.json (passed=None means validation was skipped)."""
+        if passed is None:
+            status = "skipped"
+        else:
+            status = "passed" if passed else "failed"
         result = {
             "validation_time": datetime.utcnow().isoformat(),
             "passed": passed,
-            "status": "passed" if passed else "failed",
+            "status": status,
             "aimo_standard_version": self.aimo_standard_version,
             "validator_version": "1.0.0",
             "errors": errors,
@@ -971,6 +1025,14 @@ class StandardEvidenceBundleGenerator:
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
     
+    def _calculate_file_blake2b(self, file_path: Path) -> str:
+        """Calculate BLAKE2b-256 hash of a file (fast checksum mode)."""
+        blake2b_hash = hashlib.blake2b(digest_size=32)
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(8192), b""):
+                blake2b_hash.update(chunk)
+        return blake2b_hash.hexdigest()
+    
     def _map_risk_to_classification(self, risk_level: str) -> str:
         """Map risk level to data classification."""
         mapping = {
@@ -187,6 +187,28 @@ class TaxonomyAdapter:
         codes = self._codes_by_dimension.get(dimension, [])
         return [c.code for c in codes]
     
+    def get_allowed_codes_bulk(self, dimensions: tuple[str, ...]) -> dict[str, list[str]]:
+        """
+        Get allowed codes for several dimensions in one call.
+        
+        Args:
+            dimensions: Dimension IDs (FS, UC, DT, CH, IM, RS, OB, LG)
+        
+        Returns:
+            Dict mapping each requested dimension to its code strings
+        
+        Raises:
+            ValueError: If any dimension is not recognized
+        """
+        unknown = [d for d in dimensions if d not in ALL_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown dimension(s): {unknown}. Valid dimensions: {ALL_DIMENSIONS}")
+        
+        return {
+            dim: [c.code for c in self._codes_by_dimension.get(dim, [])]
+            for dim in dimensions
+        }
+    
     def get_code_info(self, code: str) -> Optional[TaxonomyCode]:
         """Get detailed info for a specific code."""
         return self._all_codes.get(code)
@@ -121,12 +121,143 @@ def schemas_dir(project_root: Path) -> Path:
     return project_root / "schemas"
 
 
+# =============================================================================
+# Report Sheet DuckDB Fixtures
+# =============================================================================
+
+# Minimal DuckDB schemas used by the Excel sheet tests (superset of the columns any test seeds)
+SIGNATURE_STATS_DDL = """
+    CREATE TABLE IF NOT EXISTS signature_stats (
+        run_id VARCHAR,
+        url_signature VARCHAR,
+        norm_host VARCHAR,
+        norm_path_template VARCHAR,
+        dest_domain VARCHAR,
+        bytes_sent_sum BIGINT,
+        access_count BIGINT,
+        unique_users BIGINT,
+        candidate_flags VARCHAR,
+        sampled BOOLEAN,
+        first_seen TIMESTAMP,
+        last_seen TIMESTAMP,
+        burst_max_5min INTEGER,
+        bytes_sent_bucket VARCHAR
+    )
+"""
+
+ANALYSIS_CACHE_DDL = """
+    CREATE TABLE IF NOT EXISTS analysis_cache (
+        url_signature VARCHAR PRIMARY KEY,
+        service_name VARCHAR,
+        category VARCHAR,
+        risk_level VARCHAR,
+        usage_type VARCHAR,
+        status VARCHAR
+    )
+"""
+
+
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory) -> Path:
+    """
+    Template database with the report sheet schemas.
+    
+    The DDL is parsed once per session; _report_db clones it per module.
+    """
+    import duckdb
+    
+    template_path = tmp_path_factory.mktemp("db") / "template.duckdb"
+    con = duckdb.connect(str(template_path))
+    con.execute(SIGNATURE_STATS_DDL)
+    con.execute(ANALYSIS_CACHE_DDL)
+    con.close()
+    return template_path
+
+
+# Tables created from the template; emptied after each test that uses db_reader
+_REPORT_TABLES = ("signature_stats", "analysis_cache")
+
+# Connection settings for the report sheet test DB
+_REPORT_DB_CONFIG = {"threads": 1}
+
+
+@pytest.fixture(scope="module")
+def _report_db(db_template):
+    """In-memory DuckDB with the template schema, created once per module."""
+    import duckdb
+    
+    # Seeds are a handful of rows: one thread avoids thread-pool overhead
+    con = duckdb.connect(":memory:", config=_REPORT_DB_CONFIG)
+    con.execute(f"ATTACH '{db_template}' AS template (READ_ONLY)")
+    con.execute("COPY FROM DATABASE template TO memory (SCHEMA)")
+    con.execute("DETACH template")
+    yield con
+    con.close()
+
+
+@pytest.fixture
+def db_reader(_report_db):
+    """
+    Module-shared in-memory DuckDB whose report tables start empty for each test.
+    
+    Rows are removed with DELETE after the test rather than rolled back: sheet
+    queries run on separate cursors, which cannot see uncommitted rows.
+    
+    Usage:
+        def test_something(db_reader):
+            db_reader.execute("INSERT INTO signature_stats ...")
+            ...
+    """
+    yield _report_db
+    for table in _REPORT_TABLES:
+        _report_db.execute(f"DELETE FROM {table}")
+
+
+# =============================================================================
+# LLM Client Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def llm_client_factory():
+    """
+    Provide a factory for minimal LLMClient instances.
+    
+    Each call returns a fresh client (built via __new__, so __init__ never
+    reads llm_providers.yaml or touches the filesystem) wired to the given
+    taxonomy adapter with an empty fallback cache.
+    
+    Usage:
+        def test_something(llm_client_factory):
+            client = llm_client_factory(mock_adapter)
+            ...
+    """
+    from llm.client import LLMClient
+    
+    def make_client(taxonomy_adapter):
+        client = LLMClient.__new__(LLMClient)
+        
+        # Minimal initialization
+        client._taxonomy_adapter = taxonomy_adapter
+        client._fallback_code_cache = {}
+        client.aimo_standard_version = "0.1.1"
+        return client
+    
+    return make_client
+
+
 # =============================================================================
 # Test Markers
 # =============================================================================
 
 def pytest_configure(config):
-    """Register custom markers."""
+    """Register custom markers and apply the optional tmp_path root."""
+    # AIMO_TEST_TMPDIR (e.g. /dev/shm) roots tmp_path on tmpfs; pytest still
+    # creates its own pytest-of-<user>/ tree under it (unlike --basetemp,
+    # which is wiped as a whole)
+    test_tmpdir = os.environ.get("AIMO_TEST_TMPDIR")
+    if test_tmpdir and config.option.basetemp is None:
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", test_tmpdir)
+    
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
@@ -139,6 +270,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "llm: marks tests that require LLM API access"
     )
+    config.addinivalue_line(
+        "markers", "no_db: marks tests that need no DuckDB fixtures (cheap to schedule under xdist)"
+    )
+    config.addinivalue_line(
+        "markers", "bundle_generator: tests that build StandardEvidenceBundleGenerator (conftest warms up Standard loading)"
+    )
 
 
 # =============================================================================
@@ -157,3 +294,24 @@ def pytest_collection_modifyitems(config, items):
         # Mark tests with 'llm' in name as llm
         if "llm" in item.name.lower():
             item.add_marker(pytest.mark.llm)
+
+
+def pytest_collection_finish(session):
+    """
+    Warm up Standard adapter loading once per process before the first test runs.
+    
+    StandardEvidenceBundleGenerator.__init__ resolves Standard artifacts and
+    populates the module-level schema/taxonomy/validator singletons. Doing it
+    here moves that cold-start cost out of the first bundle test. Runs only
+    when a collected test carries the bundle_generator marker, and never
+    under --collect-only.
+    """
+    if session.config.option.collectonly:
+        return
+    if not any(item.get_closest_marker("bundle_generator") for item in session.items):
+        return
+    
+    from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
+    
+    # Default Standard version; __init__ never raises (adapter failures are warnings)
+    StandardEvidenceBundleGenerator()
@@ -79,6 +79,10 @@ from standard_adapter.pinning import (
 )
 
 
+# Builds StandardEvidenceBundleGenerator instances (conftest warms up Standard loading once)
+pytestmark = pytest.mark.bundle_generator
+
+
 class TestContractE2EStandardBundle:
     """
     Contract E2E test for Evidence Bundle generation.
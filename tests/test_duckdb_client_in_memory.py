@@ -0,0 +1,63 @@
+"""
+Test DuckDBClient in-memory mode
+
+DuckDBClient(":memory:") shares one connection between schema init, the
+writer queue and readers, so queued writes are visible to get_reader()
+and nothing is written next to the working directory.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from db.duckdb_client import DuckDBClient
+
+
+class TestInMemoryClient:
+    """Test DuckDBClient(":memory:")."""
+    
+    def test_reader_sees_queued_writes(self, tmp_path):
+        """Writes through the writer queue are visible to get_reader()."""
+        client = DuckDBClient(":memory:", temp_directory=str(tmp_path / "duckdb_tmp"))
+        try:
+            client.insert("runs", {
+                "run_id": "mem_run_001",
+                "run_key": "mem_key",
+                "started_at": "2024-01-01T00:00:00",
+                "status": "running",
+                "input_manifest_hash": "hash",
+                "signature_version": "1.0",
+                "rule_version": "1",
+                "prompt_version": "1"
+            })
+            client.flush()
+            
+            reader = client.get_reader()
+            count = reader.execute(
+                "SELECT COUNT(*) FROM runs WHERE run_id = ?", ["mem_run_001"]
+            ).fetchone()[0]
+            assert count == 1
+            
+            # Closing the reader must not drop the shared in-memory DB
+            client.close_reader(reader)
+            assert client.get_reader().execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        finally:
+            client.close()
+    
+    def test_schema_initialized_without_db_file(self, tmp_path, monkeypatch):
+        """Schema is created in memory; no database file appears on disk."""
+        monkeypatch.chdir(tmp_path)
+        client = DuckDBClient(":memory:", temp_directory=str(tmp_path / "duckdb_tmp"))
+        try:
+            tables = {
+                row[0] for row in client.get_reader().execute(
+                    "SELECT table_name FROM information_schema.tables"
+                ).fetchall()
+            }
+            assert {"runs", "signature_stats", "analysis_cache"} <= tables
+            assert not (tmp_path / ":memory:").exists()
+        finally:
+            client.close()
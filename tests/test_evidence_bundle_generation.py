@@ -22,6 +22,42 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from db.duckdb_client import DuckDBClient
 
 
+# Builds StandardEvidenceBundleGenerator instances (conftest warms up Standard loading once)
+pytestmark = pytest.mark.bundle_generator
+
+
+# Fixed timestamp for run context / runs.started_at (tests never assert on it)
+_FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
+_FROZEN_NOW_ISO = _FROZEN_NOW.isoformat()
+
+# Seed data (column order matches the *_COLUMNS tuples)
+SIGNATURE_STATS_COLUMNS = (
+    "run_id", "url_signature", "norm_host", "norm_path_template", "dest_domain",
+    "bytes_sent_sum", "access_count", "unique_users", "candidate_flags",
+)
+SIGNATURE_STATS_ROWS = [
+    # run_id is filled in by the fixture
+    ("test_sig_001", "chat.openai.com", "/api/chat", "openai.com", 10000, 100, 5, "A|genai"),
+    ("test_sig_002", "www.google.com", "/search", "google.com", 5000, 50, 3, "B"),
+]
+
+ANALYSIS_CACHE_COLUMNS = (
+    "url_signature", "service_name", "category", "usage_type", "risk_level",
+    "confidence", "classification_source", "rationale_short",
+    "fs_code", "im_code", "uc_codes_json", "dt_codes_json", "ch_codes_json",
+    "rs_codes_json", "ev_codes_json", "ob_codes_json",
+    "taxonomy_schema_version", "status",
+)
+ANALYSIS_CACHE_ROWS = [
+    ("test_sig_001", "ChatGPT", "GenAI", "genai", "high", 0.95, "LLM",
+     "OpenAI ChatGPT service", "FS-001", "IM-001", '["UC-001"]', '["DT-001"]',
+     '["CH-001"]', '["RS-001"]', '["LG-001"]', '[]', "0.1.1", "active"),
+    ("test_sig_002", "Google Search", "Search", "business", "low", 0.98, "RULE",
+     "Google search engine", "FS-002", "IM-002", '["UC-002"]', '["DT-002"]',
+     '["CH-001"]', '["RS-002"]', '["LG-001"]', '[]', "0.1.1", "active"),
+]
+
+
 @dataclass
 class MockRunContext:
     """Mock run context for testing."""
@@ -42,14 +78,19 @@ class MockRunContext:
     
     def __post_init__(self):
         if self.started_at is None:
-            self.started_at = datetime.utcnow()
+            self.started_at = _FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def fast_checksums(monkeypatch):
+    """Use fast checksums by default; checksum-format tests opt back into SHA-256."""
+    monkeypatch.setenv("AIMO_FAST_HASH", "1")
 
 
 @pytest.fixture
 def temp_db(tmp_path):
-    """Create temporary DuckDB database with test data."""
-    db_path = tmp_path / "test.duckdb"
-    client = DuckDBClient(str(db_path))
+    """Create in-memory DuckDB database (never reopened from disk by these tests)."""
+    client = DuckDBClient(":memory:", temp_directory=str(tmp_path / "duckdb_tmp"))
     yield client
     client.close()
 
@@ -69,85 +110,29 @@ def db_with_test_data(temp_db, sample_run_context):
     """Create DB with test analysis data."""
     run_id = sample_run_context.run_id
     
-    # Insert run record
-    temp_db.upsert("runs", {
+    # Insert run record (fresh DB: plain INSERT, no ON CONFLICT planning)
+    temp_db.insert("runs", {
         "run_id": run_id,
         "run_key": sample_run_context.run_key,
-        "started_at": datetime.utcnow().isoformat(),
+        "started_at": _FROZEN_NOW_ISO,
         "status": "running",
         "input_manifest_hash": sample_run_context.input_manifest_hash,
         "signature_version": "1.0",
         "rule_version": "1",
         "prompt_version": "1"
-    }, conflict_key="run_id")
-    
-    # Insert signature_stats
-    temp_db.upsert("signature_stats", {
-        "run_id": run_id,
-        "url_signature": "test_sig_001",
-        "norm_host": "chat.openai.com",
-        "norm_path_template": "/api/chat",
-        "dest_domain": "openai.com",
-        "bytes_sent_sum": 10000,
-        "access_count": 100,
-        "unique_users": 5,
-        "candidate_flags": "A|genai"
-    }, conflict_key="run_id, url_signature")
-    
-    temp_db.upsert("signature_stats", {
-        "run_id": run_id,
-        "url_signature": "test_sig_002",
-        "norm_host": "www.google.com",
-        "norm_path_template": "/search",
-        "dest_domain": "google.com",
-        "bytes_sent_sum": 5000,
-        "access_count": 50,
-        "unique_users": 3,
-        "candidate_flags": "B"
-    }, conflict_key="run_id, url_signature")
-    
-    # Insert analysis_cache
-    temp_db.upsert("analysis_cache", {
-        "url_signature": "test_sig_001",
-        "service_name": "ChatGPT",
-        "category": "GenAI",
-        "usage_type": "genai",
-        "risk_level": "high",
-        "confidence": 0.95,
-        "classification_source": "LLM",
-        "rationale_short": "OpenAI ChatGPT service",
-        "fs_code": "FS-001",
-        "im_code": "IM-001",
-        "uc_codes_json": '["UC-001"]',
-        "dt_codes_json": '["DT-001"]',
-        "ch_codes_json": '["CH-001"]',
-        "rs_codes_json": '["RS-001"]',
-        "ev_codes_json": '["LG-001"]',
-        "ob_codes_json": '[]',
-        "taxonomy_schema_version": "0.1.1",
-        "status": "active"
-    }, conflict_key="url_signature")
+    })
     
-    temp_db.upsert("analysis_cache", {
-        "url_signature": "test_sig_002",
-        "service_name": "Google Search",
-        "category": "Search",
-        "usage_type": "business",
-        "risk_level": "low",
-        "confidence": 0.98,
-        "classification_source": "RULE",
-        "rationale_short": "Google search engine",
-        "fs_code": "FS-002",
-        "im_code": "IM-002",
-        "uc_codes_json": '["UC-002"]',
-        "dt_codes_json": '["DT-002"]',
-        "ch_codes_json": '["CH-001"]',
-        "rs_codes_json": '["RS-002"]',
-        "ev_codes_json": '["LG-001"]',
-        "ob_codes_json": '[]',
-        "taxonomy_schema_version": "0.1.1",
-        "status": "active"
-    }, conflict_key="url_signature")
+    # Seed rows in one batched INSERT per table (fresh DB, no conflicts possible)
+    temp_db.execute_many(
+        f"INSERT INTO signature_stats ({', '.join(SIGNATURE_STATS_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in SIGNATURE_STATS_COLUMNS)})",
+        [(run_id, *row) for row in SIGNATURE_STATS_ROWS]
+    )
+    temp_db.execute_many(
+        f"INSERT INTO analysis_cache ({', '.join(ANALYSIS_CACHE_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in ANALYSIS_CACHE_COLUMNS)})",
+        ANALYSIS_CACHE_ROWS
+    )
     
     temp_db.flush()
     
@@ -185,7 +170,8 @@ class TestBundleGeneration:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=True
+            include_derived=True,
+            include_validation=False
         )
         
         # Check result structure
@@ -206,12 +192,12 @@ class TestBundleGeneration:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=False
+            include_derived=False,
+            include_validation=False
         )
         
         # Read run_manifest.json
-        with open(result.run_manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = json.loads(result.run_manifest_path.read_bytes())
         
         # Check Standard version info
         assert "aimo_standard" in manifest
@@ -233,12 +219,12 @@ class TestBundleGeneration:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=False
+            include_derived=False,
+            include_validation=False
         )
         
         # Read evidence_pack_manifest.json
-        with open(result.evidence_pack_manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manifest = json.loads(result.evidence_pack_manifest_path.read_bytes())
         
         # Check required fields per Standard schema
         assert "pack_id" in manifest
@@ -276,8 +262,7 @@ class TestBundleGeneration:
         assert result.validation_result_path.exists()
         
         # Read validation result
-        with open(result.validation_result_path, 'r', encoding='utf-8') as f:
-            validation = json.load(f)
+        validation = json.loads(result.validation_result_path.read_bytes())
         
         assert "passed" in validation
         assert "status" in validation
@@ -285,22 +270,24 @@ class TestBundleGeneration:
         assert "errors" in validation
         assert "error_count" in validation
     
-    def test_checksums_contains_all_files(self, db_with_test_data, sample_run_context):
+    def test_checksums_contains_all_files(self, db_with_test_data, sample_run_context, monkeypatch):
         """Test that checksums.json contains all generated files."""
         from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
         
+        monkeypatch.delenv("AIMO_FAST_HASH", raising=False)
+        
         generator = StandardEvidenceBundleGenerator(aimo_standard_version="0.1.1")
         
         result = generator.generate(
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=False
+            include_derived=False,
+            include_validation=False
         )
         
         # Read checksums.json
-        with open(result.checksums_path, 'r', encoding='utf-8') as f:
-            checksums = json.load(f)
+        checksums = json.loads(result.checksums_path.read_bytes())
         
         assert "algorithm" in checksums
         assert checksums["algorithm"] == "SHA-256"
@@ -315,6 +302,25 @@ class TestBundleGeneration:
             assert len(checksum) == 64
             assert all(c in "0123456789abcdef" for c in checksum)
     
+    def test_fast_checksums_labelled(self, db_with_test_data, sample_run_context):
+        """Test that AIMO_FAST_HASH checksums are labelled BLAKE2b-256, never SHA-256."""
+        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
+        
+        generator = StandardEvidenceBundleGenerator(aimo_standard_version="0.1.1")
+        
+        result = generator.generate(
+            run_context=sample_run_context,
+            output_dir=sample_run_context.work_dir,
+            db_reader=db_with_test_data.get_reader(),
+            include_derived=False,
+            include_validation=False
+        )
+        
+        checksums = json.loads(result.checksums_path.read_bytes())
+        
+        assert checksums["algorithm"] == "BLAKE2b-256"
+        assert all(len(checksum) == 64 for checksum in checksums["files"].values())
+    
     def test_shadow_ai_discovery_log_generated(self, db_with_test_data, sample_run_context):
         """Test that shadow_ai_discovery.jsonl is generated."""
         from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
@@ -325,29 +331,30 @@ class TestBundleGeneration:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=False
+            include_derived=False,
+            include_validation=False
         )
         
         # Check logs directory exists (v0.1: under payloads/)
-        logs_dir = result.bundle_path / "payloads" / "logs"
-        assert logs_dir.exists()
+        assert result.logs_dir.exists()
         
         # Check shadow_ai_discovery.jsonl exists (file should be created even if empty)
-        shadow_ai_log = logs_dir / "shadow_ai_discovery.jsonl"
+        shadow_ai_log = result.shadow_ai_log_path
         assert shadow_ai_log.exists()
         
-        # Read log entries (may be empty if no GenAI data in test DB)
-        with open(shadow_ai_log, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # If there are entries, validate structure
-        if len(lines) > 0:
-            entry = json.loads(lines[0])
-            assert "event_time" in entry
-            assert "actor_id" in entry
-            assert "ai_service" in entry
-            assert "decision" in entry
-            assert "record_id" in entry
+        # Probe only the first entry (log may be empty if no GenAI data in test DB)
+        with open(shadow_ai_log, 'rb') as f:
+            first = f.readline()
+        if not first:
+            return
+        
+        # Validate structure of the first entry
+        entry = json.loads(first)
+        assert "event_time" in entry
+        assert "actor_id" in entry
+        assert "ai_service" in entry
+        assert "decision" in entry
+        assert "record_id" in entry
 
     def test_v01_root_structure(self, db_with_test_data, sample_run_context):
         """Test that bundle has v0.1 root structure: manifest.json, objects/, payloads/, signatures/, hashes/."""
@@ -359,16 +366,16 @@ class TestBundleGeneration:
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
             include_derived=False,
+            include_validation=False,
         )
         root = result.bundle_path
         assert (root / "manifest.json").exists()
         assert (root / "objects").is_dir()
-        assert (root / "objects" / "index.json").exists()
-        assert (root / "payloads").is_dir()
+        assert result.objects_index_path.exists()
+        assert result.payloads_dir.is_dir()
         assert (root / "signatures").is_dir()
         assert (root / "hashes").is_dir()
-        with open(root / "manifest.json", "r", encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = json.loads((root / "manifest.json").read_bytes())
         assert "bundle_id" in manifest
         assert "object_index" in manifest
         assert "payload_index" in manifest
@@ -388,14 +395,14 @@ class TestBundleGeneration:
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
             include_derived=False,
+            include_validation=False,
         )
-        payloads = result.bundle_path / "payloads"
+        payloads = result.payloads_dir
         assert (payloads / "summary.json").exists(), "payloads/summary.json required (Phase 3)"
         assert (payloads / "change_log.json").exists(), "payloads/change_log.json required (Phase 3)"
         # dictionary.json is optional when Standard artifacts are unavailable
         if (payloads / "dictionary.json").exists():
-            with open(payloads / "summary.json", "r", encoding="utf-8") as f:
-                summary = json.load(f)
+            summary = json.loads((payloads / "summary.json").read_bytes())
             assert "run_id" in summary and "total_signatures" in summary
 
 
@@ -433,17 +440,12 @@ class TestBundleValidation:
         )
         
         # Check validation result file contains error info
-        with open(result.validation_result_path, 'r', encoding='utf-8') as f:
-            validation = json.load(f)
+        validation = json.loads(result.validation_result_path.read_bytes())
         
         assert validation["error_count"] == len(validation["errors"])
-
-
-class TestDerivedOutputs:
-    """Tests for derived (legacy) outputs."""
     
-    def test_derived_outputs_generated(self, db_with_test_data, sample_run_context):
-        """Test that derived outputs are generated when requested."""
+    def test_validation_skipped_when_disabled(self, db_with_test_data, sample_run_context):
+        """Test that include_validation=False writes a 'skipped' validation result."""
         from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
         
         generator = StandardEvidenceBundleGenerator(aimo_standard_version="0.1.1")
@@ -452,16 +454,26 @@ class TestDerivedOutputs:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=True
+            include_derived=False,
+            include_validation=False
         )
         
-        # Check derived directory exists
-        # v0.1: derived outputs under payloads/
-        derived_dir = result.bundle_path / "payloads" / "derived"
-        assert derived_dir.exists()
+        assert result.validation_passed is None
+        assert result.validation_errors == []
+        
+        validation = json.loads(result.validation_result_path.read_bytes())
+        
+        assert validation["passed"] is None
+        assert validation["status"] == "skipped"
+        assert validation["error_count"] == 0
+
+
+class TestDerivedOutputs:
+    """Tests for derived (legacy) outputs."""
     
-    def test_derived_outputs_skipped_when_disabled(self, db_with_test_data, sample_run_context):
-        """Test that derived outputs are skipped when disabled."""
+    @pytest.mark.parametrize("include_derived", [True, False], ids=["enabled", "disabled"])
+    def test_derived_outputs(self, db_with_test_data, sample_run_context, include_derived):
+        """Test that derived outputs are generated only when requested."""
         from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
         
         generator = StandardEvidenceBundleGenerator(aimo_standard_version="0.1.1")
@@ -470,19 +482,14 @@ class TestDerivedOutputs:
             run_context=sample_run_context,
             output_dir=sample_run_context.work_dir,
             db_reader=db_with_test_data.get_reader(),
-            include_derived=False
+            include_derived=include_derived,
+            include_validation=False
         )
         
-        # Derived directory should not be in files list
         derived_files = [f for f in result.files_generated if "derived" in f]
-        assert len(derived_files) == 0
-
-
-class TestOrchestratorIntegration:
-    """Tests for Orchestrator integration."""
-    
-    def test_orchestrator_has_generate_evidence_bundle(self):
-        """Test that Orchestrator has generate_evidence_bundle method."""
-        from orchestrator import Orchestrator
-        
-        assert hasattr(Orchestrator, 'generate_evidence_bundle')
+        if include_derived:
+            # v0.1: derived outputs under payloads/
+            assert result.derived_dir.exists()
+        else:
+            # Derived files should not be in files list
+            assert len(derived_files) == 0
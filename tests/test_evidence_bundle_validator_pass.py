@@ -18,21 +18,47 @@ Environment:
 
 import pytest
 import json
-import sys
-import os
+import re
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pyarrow as pa
 
 # Import pinned Standard version for consistency
 from standard_adapter.pinning import PINNED_STANDARD_VERSION
 
 
-@pytest.fixture(autouse=True)
+# Builds StandardEvidenceBundleGenerator instances (conftest warms up Standard loading once)
+pytestmark = pytest.mark.bundle_generator
+
+
+# Fixed timestamp for run metadata (value is irrelevant to the contract; keeps runs deterministic)
+_FIXED_TEST_TIME = datetime(2024, 1, 1, 0, 0, 0)
+_FIXED_TEST_TIME_ISO = _FIXED_TEST_TIME.isoformat()
+
+# Standard CLI schema-structure messages (manifest format differences), not content errors
+_CLI_NOISE_RE = re.compile("|".join(map(re.escape, [
+    "DeprecationWarning",
+    "RefResolver",
+    "Schema validation failed",
+    "Additional properties are not allowed",
+    "'version' is a required property",
+    "'dictionary' is a required property",
+    "'evidence' is a required property",
+    "is not of type 'object'",
+    "is not of type 'string'",
+])))
+
+
+def _filter_content_errors(errors):
+    """Drop Standard CLI schema-structure messages, keeping content validation errors."""
+    return [e for e in errors if not _CLI_NOISE_RE.search(e)]
+
+
+@pytest.fixture(autouse=True, scope="module")
 def contract_test_environment():
     """
     Set up contract test environment.
@@ -40,25 +66,14 @@ def contract_test_environment():
     Ensures:
     - AIMO_DISABLE_LLM=1: LLM calls are disabled
     - AIMO_CLASSIFIER=stub: Stub classifier is used
-    """
-    original_disable_llm = os.environ.get("AIMO_DISABLE_LLM")
-    original_classifier = os.environ.get("AIMO_CLASSIFIER")
     
-    os.environ["AIMO_DISABLE_LLM"] = "1"
-    os.environ["AIMO_CLASSIFIER"] = "stub"
-    
-    yield
-    
-    # Restore original values
-    if original_disable_llm is not None:
-        os.environ["AIMO_DISABLE_LLM"] = original_disable_llm
-    else:
-        os.environ.pop("AIMO_DISABLE_LLM", None)
-    
-    if original_classifier is not None:
-        os.environ["AIMO_CLASSIFIER"] = original_classifier
-    else:
-        os.environ.pop("AIMO_CLASSIFIER", None)
+    Module-scoped so the variables are already set when the module-scoped
+    bundle fixtures run; MonkeyPatch restores the originals on teardown.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AIMO_DISABLE_LLM", "1")
+        mp.setenv("AIMO_CLASSIFIER", "stub")
+        yield
 
 
 @dataclass
@@ -79,7 +94,7 @@ class MockRunContext:
     """
     run_id: str = "contract_test_run_001"
     run_key: str = "contract_test_run_key_hash"
-    started_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime = _FIXED_TEST_TIME
     status: str = "running"
     input_manifest_hash: str = "contract_input_hash_123"
     signature_version: str = "1.0"
@@ -97,72 +112,89 @@ class MockRunContext:
             self.standard_info = MockStandardInfo()
 
 
-@pytest.fixture
-def temp_db(tmp_path):
-    """Create temporary DuckDB database."""
+@pytest.fixture(scope="session")
+def temp_db(tmp_path_factory):
+    """Create in-memory DuckDB database (schema created once per session; no DB file or WAL)."""
     from db.duckdb_client import DuckDBClient
     
-    db_path = tmp_path / "contract_test.duckdb"
-    client = DuckDBClient(str(db_path))
+    temp_dir = tmp_path_factory.mktemp("duckdb_tmp")
+    client = DuckDBClient(":memory:", temp_directory=str(temp_dir))
     yield client
     client.close()
 
 
-@pytest.fixture
-def minimal_run_context(tmp_path):
+@pytest.fixture(scope="module")
+def clean_db(temp_db):
+    """Empty the tables seeded by db_with_minimal_data so the module starts clean."""
+    for table in ("runs", "signature_stats", "analysis_cache"):
+        temp_db.execute_sql(f"DELETE FROM {table}")
+    return temp_db
+
+
+@pytest.fixture(scope="module")
+def minimal_run_context(tmp_path_factory):
     """Create minimal run context for contract test."""
-    work_dir = tmp_path / "work" / "contract_test_run_001"
+    work_dir = tmp_path_factory.mktemp("work") / "contract_test_run_001"
     work_dir.mkdir(parents=True, exist_ok=True)
     
     return MockRunContext(work_dir=work_dir)
 
 
-@pytest.fixture
-def db_with_minimal_data(temp_db, minimal_run_context):
+@pytest.fixture(scope="session")
+def taxonomy_codes():
     """
-    Create DB with minimal valid data for Evidence Bundle generation.
+    First valid code per dimension, resolved once per session (read-only mapping).
     
-    Uses Standard-compliant codes obtained from stub classifier logic.
+    Same logic as stub_classifier; falls back to fixed codes if the Standard
+    adapter is unavailable (Standard 0.1.1: LG dimension).
     """
-    run_id = minimal_run_context.run_id
-    
-    # Get valid codes from Standard Adapter (same logic as stub_classifier)
     try:
         from standard_adapter.taxonomy import get_taxonomy_adapter
         adapter = get_taxonomy_adapter(version=PINNED_STANDARD_VERSION)
-        
-        # Get first valid code for each dimension
-        fs_code = adapter.get_allowed_codes("FS")[0]
-        im_code = adapter.get_allowed_codes("IM")[0]
-        uc_code = adapter.get_allowed_codes("UC")[0]
-        dt_code = adapter.get_allowed_codes("DT")[0]
-        ch_code = adapter.get_allowed_codes("CH")[0]
-        rs_code = adapter.get_allowed_codes("RS")[0]
-        lg_code = adapter.get_allowed_codes("LG")[0]
+        allowed = adapter.get_allowed_codes_bulk(("FS", "IM", "UC", "DT", "CH", "RS", "LG"))
+        codes = {dim: dim_codes[0] for dim, dim_codes in allowed.items()}
     except Exception:
-        # Fallback if adapter not available (Standard 0.1.1: LG dimension)
-        fs_code = "FS-001"
-        im_code = "IM-001"
-        uc_code = "UC-001"
-        dt_code = "DT-001"
-        ch_code = "CH-001"
-        rs_code = "RS-001"
-        lg_code = "LG-001"
+        codes = {
+            "FS": "FS-001",
+            "IM": "IM-001",
+            "UC": "UC-001",
+            "DT": "DT-001",
+            "CH": "CH-001",
+            "RS": "RS-001",
+            "LG": "LG-001",
+        }
+    return MappingProxyType(codes)
+
+
+@pytest.fixture(scope="session")
+def taxonomy_codes_json(taxonomy_codes):
+    """Single-code JSON arrays (analysis_cache *_codes_json columns), serialized once per session."""
+    return MappingProxyType({dim: json.dumps([code]) for dim, code in taxonomy_codes.items()})
+
+
+@pytest.fixture(scope="module")
+def db_with_minimal_data(clean_db, minimal_run_context, taxonomy_codes, taxonomy_codes_json):
+    """
+    Create DB with minimal valid data for Evidence Bundle generation.
+    
+    Uses Standard-compliant codes obtained from stub classifier logic.
+    """
+    run_id = minimal_run_context.run_id
     
-    # Insert run record
-    temp_db.upsert("runs", {
+    # Bulk-insert one Arrow table per table (fresh DB: plain INSERT ... SELECT)
+    clean_db.insert_arrow("runs", pa.Table.from_pylist([{
         "run_id": run_id,
         "run_key": minimal_run_context.run_key,
-        "started_at": datetime.utcnow().isoformat(),
+        "started_at": _FIXED_TEST_TIME_ISO,
         "status": "running",
         "input_manifest_hash": minimal_run_context.input_manifest_hash,
         "signature_version": "1.0",
         "rule_version": "1",
         "prompt_version": "1"
-    }, conflict_key="run_id")
+    }]))
     
-    # Insert minimal signature_stats
-    temp_db.upsert("signature_stats", {
+    # Minimal signature_stats
+    clean_db.insert_arrow("signature_stats", pa.Table.from_pylist([{
         "run_id": run_id,
         "url_signature": "contract_test_sig_001",
         "norm_host": "test.example.com",
@@ -172,10 +204,10 @@ def db_with_minimal_data(temp_db, minimal_run_context):
         "access_count": 10,
         "unique_users": 1,
         "candidate_flags": "A"
-    }, conflict_key="run_id, url_signature")
+    }]))
     
-    # Insert minimal analysis_cache with Standard-compliant codes
-    temp_db.upsert("analysis_cache", {
+    # Minimal analysis_cache with Standard-compliant codes
+    clean_db.insert_arrow("analysis_cache", pa.Table.from_pylist([{
         "url_signature": "contract_test_sig_001",
         "service_name": "Contract Test Service",
         "category": "Test",
@@ -184,21 +216,49 @@ def db_with_minimal_data(temp_db, minimal_run_context):
         "confidence": 0.9,
         "classification_source": "STUB",
         "rationale_short": "Contract test classification",
-        "fs_code": fs_code,
-        "im_code": im_code,
-        "uc_codes_json": json.dumps([uc_code]),
-        "dt_codes_json": json.dumps([dt_code]),
-        "ch_codes_json": json.dumps([ch_code]),
-        "rs_codes_json": json.dumps([rs_code]),
-        "ev_codes_json": json.dumps([lg_code]),
+        "fs_code": taxonomy_codes["FS"],
+        "im_code": taxonomy_codes["IM"],
+        "uc_codes_json": taxonomy_codes_json["UC"],
+        "dt_codes_json": taxonomy_codes_json["DT"],
+        "ch_codes_json": taxonomy_codes_json["CH"],
+        "rs_codes_json": taxonomy_codes_json["RS"],
+        "ev_codes_json": taxonomy_codes_json["LG"],
         "ob_codes_json": "[]",
         "taxonomy_schema_version": PINNED_STANDARD_VERSION,
         "status": "active"
-    }, conflict_key="url_signature")
+    }]))
     
-    temp_db.flush()
+    # Single barrier for the queued DELETEs and seeds: makes them visible to
+    # get_reader(). In-memory mode has no WAL, so no fsync/CHECKPOINT is involved.
+    clean_db.flush()
     
-    return temp_db
+    return clean_db
+
+
+@pytest.fixture(scope="module")
+def generated_bundle(db_with_minimal_data, minimal_run_context):
+    """
+    Generate the Evidence Bundle once; every test here inspects the same output.
+    
+    Returns (result, validation) where validation is validation_result.json
+    parsed once (None if the file was not written).
+    """
+    from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
+    
+    generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
+    
+    result = generator.generate(
+        run_context=minimal_run_context,
+        output_dir=minimal_run_context.work_dir,
+        db_reader=db_with_minimal_data.get_reader(),
+        include_derived=False
+    )
+    
+    validation = None
+    if result.validation_result_path is not None and result.validation_result_path.exists():
+        validation = json.loads(result.validation_result_path.read_bytes())
+    
+    return result, validation
 
 
 class TestEvidenceBundleValidatorPass:
@@ -210,23 +270,14 @@ class TestEvidenceBundleValidatorPass:
     """
     
     def test_validation_result_json_is_generated(
-        self, db_with_minimal_data, minimal_run_context
+        self, generated_bundle
     ):
         """
         Test that validation_result.json is generated in the bundle.
         
         This is a prerequisite for validator pass verification.
         """
-        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
-        
-        generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
-        
-        result = generator.generate(
-            run_context=minimal_run_context,
-            output_dir=minimal_run_context.work_dir,
-            db_reader=db_with_minimal_data.get_reader(),
-            include_derived=False
-        )
+        result, _ = generated_bundle
         
         # validation_result.json must exist
         assert result.validation_result_path is not None, \
@@ -234,8 +285,9 @@ class TestEvidenceBundleValidatorPass:
         assert result.validation_result_path.exists(), \
             f"validation_result.json not found at {result.validation_result_path}"
     
+    @pytest.mark.parametrize("error_source", ["validation_json", "bundle_result"])
     def test_validator_passes_for_standard_v0_1_1(
-        self, db_with_minimal_data, minimal_run_context
+        self, generated_bundle, error_source
     ):
         """
         CRITICAL CONTRACT: Fallback Validator MUST PASS for Standard v0.1.1 (pinned).
@@ -245,6 +297,8 @@ class TestEvidenceBundleValidatorPass:
         2. Fallback validator runs against the bundle
         3. Validation PASSES (no errors from fallback validation)
         
+        Checked against both validation_result.json and BundleGenerationResult.
+        
         NOTE: Standard CLI validation may fail due to manifest schema differences.
         This is tracked separately. The fallback validation checks:
         - Taxonomy codes are valid
@@ -253,45 +307,24 @@ class TestEvidenceBundleValidatorPass:
         
         If this test fails after a Standard upgrade, the Engine needs adaptation.
         """
-        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
-        
-        generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
+        result, validation = generated_bundle
         
-        result = generator.generate(
-            run_context=minimal_run_context,
-            output_dir=minimal_run_context.work_dir,
-            db_reader=db_with_minimal_data.get_reader(),
-            include_derived=False
-        )
+        if error_source == "validation_json":
+            # CRITICAL ASSERTIONS
+            assert validation is not None, \
+                "validation_result.json was not written"
+            assert "passed" in validation, \
+                "validation_result.json must contain 'passed' field"
+            assert "errors" in validation, \
+                "validation_result.json must contain 'errors' field"
+            assert "error_count" in validation, \
+                "validation_result.json must contain 'error_count' field"
+            errors = validation["errors"]
+        else:
+            errors = result.validation_errors
         
-        # Read validation_result.json
-        with open(result.validation_result_path, 'r', encoding='utf-8') as f:
-            validation = json.load(f)
-        
-        # CRITICAL ASSERTIONS
-        assert "passed" in validation, \
-            "validation_result.json must contain 'passed' field"
-        assert "errors" in validation, \
-            "validation_result.json must contain 'errors' field"
-        assert "error_count" in validation, \
-            "validation_result.json must contain 'error_count' field"
-        
-        # Filter out Standard CLI errors (manifest schema differences)
         # Focus on content validation errors only
-        content_errors = [
-            e for e in validation.get("errors", [])
-            if not any(x in e for x in [
-                "DeprecationWarning",
-                "RefResolver",
-                "Schema validation failed",
-                "Additional properties are not allowed",
-                "'version' is a required property",
-                "'dictionary' is a required property",
-                "'evidence' is a required property",
-                "is not of type 'object'",
-                "is not of type 'string'"
-            ])
-        ]
+        content_errors = _filter_content_errors(errors)
         
         # THE CONTRACT: No content validation errors
         # Schema structure errors from Standard CLI are separate issue
@@ -299,74 +332,21 @@ class TestEvidenceBundleValidatorPass:
             f"Content validation errors found: {content_errors}"
     
     def test_validation_result_contains_standard_version(
-        self, db_with_minimal_data, minimal_run_context
+        self, generated_bundle
     ):
         """
         Test that validation_result.json contains Standard version info.
         
         This ensures traceability of which Standard version was used for validation.
         """
-        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
-        
-        generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
-        
-        result = generator.generate(
-            run_context=minimal_run_context,
-            output_dir=minimal_run_context.work_dir,
-            db_reader=db_with_minimal_data.get_reader(),
-            include_derived=False
-        )
-        
-        with open(result.validation_result_path, 'r', encoding='utf-8') as f:
-            validation = json.load(f)
+        _, validation = generated_bundle
         
+        assert validation is not None, \
+            "validation_result.json was not written"
         assert "aimo_standard_version" in validation, \
             "validation_result.json must contain 'aimo_standard_version'"
         assert validation["aimo_standard_version"] == PINNED_STANDARD_VERSION, \
             f"Expected Standard version {PINNED_STANDARD_VERSION}, got {validation['aimo_standard_version']}"
-    
-    def test_bundle_result_no_content_validation_errors(
-        self, db_with_minimal_data, minimal_run_context
-    ):
-        """
-        Test that BundleGenerationResult has no content validation errors.
-        
-        NOTE: Standard CLI may report schema structure errors due to manifest
-        format differences. This test focuses on content validation:
-        - Taxonomy codes are valid
-        - Evidence files exist
-        - Required fields are present in manifest
-        """
-        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
-        
-        generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
-        
-        result = generator.generate(
-            run_context=minimal_run_context,
-            output_dir=minimal_run_context.work_dir,
-            db_reader=db_with_minimal_data.get_reader(),
-            include_derived=False
-        )
-        
-        # Filter out Standard CLI schema structure errors
-        content_errors = [
-            e for e in result.validation_errors
-            if not any(x in e for x in [
-                "DeprecationWarning",
-                "RefResolver",
-                "Schema validation failed",
-                "Additional properties are not allowed",
-                "'version' is a required property",
-                "'dictionary' is a required property",
-                "'evidence' is a required property",
-                "is not of type 'object'",
-                "is not of type 'string'"
-            ])
-        ]
-        
-        # No content validation errors should be present
-        assert len(content_errors) == 0, \
-            f"Content validation errors found: {content_errors}"
 
 
 class TestValidatorFailureDetection:
@@ -377,7 +357,7 @@ class TestValidatorFailureDetection:
     """
     
     def test_validation_result_structure_is_complete(
-        self, db_with_minimal_data, minimal_run_context
+        self, generated_bundle
     ):
         """
         Test that validation_result.json has all required fields.
@@ -390,19 +370,10 @@ class TestValidatorFailureDetection:
         - error_count: int
         - validated_at: str (ISO timestamp)
         """
-        from reporting.standard_evidence_bundle_generator import StandardEvidenceBundleGenerator
-        
-        generator = StandardEvidenceBundleGenerator(aimo_standard_version=PINNED_STANDARD_VERSION)
-        
-        result = generator.generate(
-            run_context=minimal_run_context,
-            output_dir=minimal_run_context.work_dir,
-            db_reader=db_with_minimal_data.get_reader(),
-            include_derived=False
-        )
+        _, validation = generated_bundle
         
-        with open(result.validation_result_path, 'r', encoding='utf-8') as f:
-            validation = json.load(f)
+        assert validation is not None, \
+            "validation_result.json was not written"
         
         # Check all required fields
         required_fields = ["passed", "status", "aimo_standard_version", "errors", "error_count"]
@@ -13,8 +13,10 @@ import tempfile
 import shutil
 from pathlib import Path
 import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -22,6 +24,147 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from reporting.excel_writer import ExcelWriter
 from reporting.report_builder import ReportBuilder
 import duckdb
+import openpyxl
+import xlsxwriter
+import zipfile
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# DuckDB-backed tests share one xdist worker (and its session template database)
+pytestmark = pytest.mark.xdist_group("duckdb")
+
+# Fixed timestamp: tests never assert on wall-clock values
+_FIXED_TIMESTAMP = "2024-01-15T00:00:00"
+
+
+@dataclass(slots=True)
+class RunContext:
+    """Minimal stand-in for the orchestrator's run context."""
+    run_id: str
+    run_key: str = ""
+    started_at: datetime = datetime.fromisoformat(_FIXED_TIMESTAMP)
+
+
+# Shared report_data; tests override only the keys they vary
+_BASE_REPORT_DATA = {
+    "run_id": "test_run_123",
+    "run_key": "test_key_456",
+    "started_at": _FIXED_TIMESTAMP,
+    "finished_at": _FIXED_TIMESTAMP,
+    "input_file": "/path/to/input.csv",
+    "vendor": "paloalto",
+    "thresholds_used": {
+        "A_min_bytes": 1048576,
+        "B_burst_count": 20,
+        "B_burst_window_seconds": 300,
+        "B_cumulative_bytes": 20971520,
+        "C_sample_rate": 0.02
+    },
+    "counts": {
+        "total_events": 1000,
+        "total_signatures": 100,
+        "unique_users": 50,
+        "unique_domains": 20,
+        "abc_count_a": 10,
+        "abc_count_b": 5,
+        "abc_count_c": 2,
+        "burst_hit": 1,
+        "cumulative_hit": 0
+    },
+    "sample": {
+        "sample_rate": 0.02,
+        "sample_method": "deterministic_hash",
+        "seed": "test_run_123"
+    },
+    "rule_coverage": {
+        "rule_hit": 80,
+        "unknown_count": 20
+    },
+    "llm_coverage": {
+        "llm_analyzed_count": 15,
+        "needs_review_count": 2,
+        "cache_hit_rate": 0.85,
+        "skipped_count": 3,
+        "llm_provider": "gemini",
+        "llm_model": "gemini-1.5-flash"
+    },
+    "signature_version": "1.0",
+    "rule_version": "1",
+    "prompt_version": "1",
+    "exclusions": {}
+}
+
+
+# Column tuples for _insert_rows seeds
+SIG_COLUMNS = ("run_id", "url_signature", "norm_host", "dest_domain", "bytes_sent_sum",
+               "access_count", "unique_users", "candidate_flags", "sampled")
+CACHE_COLUMNS = ("url_signature", "service_name", "category", "risk_level", "usage_type", "status")
+
+# Per-index seed strings, built once and sliced by the tests that need them
+_SEED_SIZE = 16
+_SEED_LINEAGE = tuple(str(i) * 64 for i in range(_SEED_SIZE))
+_SEED_USERS = tuple(f"user{i}" for i in range(_SEED_SIZE))
+_SEED_URLS = tuple(f"https://example.com/path{i}" for i in range(_SEED_SIZE))
+_SEED_SIGS = tuple(f"sig{i}" for i in range(_SEED_SIZE))
+# Alternates week 1 (2024-01-08..14) and week 2 (2024-01-15..21)
+_SEED_EVENT_TIMES = tuple(f"2024-01-{8 + (i % 2) * 7 + i % 7}T10:00:00Z" for i in range(_SEED_SIZE))
+
+
+def _insert_rows(con, table: str, columns: tuple, rows: list) -> None:
+    """Bulk-insert positional rows via a registered Arrow table (no VALUES-list SQL)."""
+    staged = pa.table({col: list(values) for col, values in zip(columns, zip(*rows))})
+    col_list = ", ".join(columns)
+    con.register("_stage", staged)
+    try:
+        con.execute(f"INSERT INTO {table} ({col_list}) SELECT {col_list} FROM _stage")
+    finally:
+        con.unregister("_stage")
+
+
+# Events in the shared time series Parquet input
+_TIME_SERIES_EVENTS = 10
+
+
+@pytest.fixture(scope="session")
+def time_series_parquet(tmp_path_factory) -> Path:
+    """
+    Processed-event Parquet for the time series sheet, written once per session.
+    
+    Events alternate between week 1 (2024-01-08..14) and week 2 (2024-01-15..21)
+    and carry the url_signature the sheet joins on.
+    """
+    n = _TIME_SERIES_EVENTS
+    path = tmp_path_factory.mktemp("time_series") / "events.parquet"
+    pq.write_table(pa.Table.from_pydict({
+        "event_time": _SEED_EVENT_TIMES[:n],
+        "vendor": ["paloalto"] * n,
+        "log_type": ["web"] * n,
+        "user_id": _SEED_USERS[:n],
+        "dest_host": ["example.com"] * n,
+        "dest_domain": ["example.com"] * n,
+        "url_full": _SEED_URLS[:n],
+        "url_signature": _SEED_SIGS[:n],
+        "action": ["block" if i % 3 == 0 else "allow" for i in range(n)],
+        "bytes_sent": [1024 * (i + 1) for i in range(n)],
+        "bytes_received": [2048 * (i + 1) for i in range(n)],
+        "ingest_file": ["test.csv"] * n,
+        "ingest_lineage_hash": _SEED_LINEAGE[:n],
+    }), path)
+    return path
+
+
+@contextmanager
+def _open_xlsx_readonly(path: Path) -> Iterator[zipfile.ZipFile]:
+    """Open an xlsx over a read-only memory map; zip members are read on demand."""
+    with pa.memory_map(str(path), "r") as source, zipfile.ZipFile(source) as xlsx:
+        yield xlsx
+
+
+@pytest.fixture(autouse=True)
+def _stored_xlsx_zip(monkeypatch):
+    """Package test workbooks uncompressed: close() skips DEFLATE, readers are unaffected."""
+    monkeypatch.setattr(xlsxwriter.workbook, "ZIP_DEFLATED", zipfile.ZIP_STORED)
 
 
 class TestExcelWriter:
@@ -37,110 +180,30 @@ class TestExcelWriter:
         assert writer.workbook is not None
         # constant_memory is set in __init__, so if workbook exists, it's configured
     
-    def test_excel_creates_all_sheets(self, tmp_path):
+    def test_excel_creates_all_sheets(self, tmp_path, db_reader):
         """Excel should create all required sheets."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
         # Create minimal report data
         report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 2,
-                "abc_count_b": 1,
-                "abc_count_c": 0,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {}
+            **_BASE_REPORT_DATA,
+            "counts": {**_BASE_REPORT_DATA["counts"], "abc_count_a": 2, "abc_count_b": 1, "abc_count_c": 0},
         }
         
         # Create mock run context
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
-        run_context.run_key = "test_key_456"
-        run_context.started_at = datetime.utcnow()
-        
-        # Create mock DB reader
-        db_reader = duckdb.connect(":memory:")
-        
-        # Initialize schema (minimal)
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN,
-                first_seen TIMESTAMP,
-                last_seen TIMESTAMP,
-                burst_max_5min INTEGER
-            )
-        """)
-        
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS analysis_cache (
-                url_signature VARCHAR PRIMARY KEY,
-                service_name VARCHAR,
-                category VARCHAR,
-                risk_level VARCHAR,
-                usage_type VARCHAR,
-                status VARCHAR
-            )
-        """)
+        run_context = RunContext(run_id="test_run_123", run_key="test_key_456")
         
         # Insert test data
-        db_reader.execute("""
-            INSERT INTO signature_stats VALUES
-            ('test_run_123', 'sig1', 'example.com', 'example.com', 1048576, 10, 5, 'A', FALSE, NULL, NULL, 0),
-            ('test_run_123', 'sig2', 'test.com', 'test.com', 512000, 5, 3, 'B', FALSE, NULL, NULL, 25)
-        """)
-        
-        db_reader.execute("""
-            INSERT INTO analysis_cache VALUES
-            ('sig1', 'TestService', 'Business', 'low', 'business', 'active'),
-            ('sig2', 'GenAIService', 'AI', 'high', 'genai', 'active')
-        """)
+        _insert_rows(db_reader, "signature_stats", SIG_COLUMNS + ("burst_max_5min",), [
+            ("test_run_123", "sig1", "example.com", "example.com", 1048576, 10, 5, "A", False, 0),
+            ("test_run_123", "sig2", "test.com", "test.com", 512000, 5, 3, "B", False, 25),
+        ])
+        
+        _insert_rows(db_reader, "analysis_cache", CACHE_COLUMNS, [
+            ("sig1", "TestService", "Business", "low", "business", "active"),
+            ("sig2", "GenAIService", "AI", "high", "genai", "active"),
+        ])
         
         # Generate Excel
         try:
@@ -151,12 +214,12 @@ class TestExcelWriter:
                 run_context=run_context
             )
             
-            # Close workbook (already closed in generate_excel)
-            writer.workbook.close()
+            # Close workbook (no-op: already closed in generate_excel)
+            writer.close()
         except Exception as e:
             # If generation fails, close workbook and re-raise
             try:
-                writer.workbook.close()
+                writer.close()
             except:
                 pass
             raise
@@ -168,78 +231,6 @@ class TestExcelWriter:
         # Note: We can't easily verify sheet contents without opening the file
         # But we can verify the file was created successfully
     
-    def test_audit_narrative_contains_required_fields(self, tmp_path):
-        """Audit narrative sheet must contain all required fields."""
-        excel_path = tmp_path / "test_report.xlsx"
-        writer = ExcelWriter(excel_path)
-        
-        report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 10,
-                "abc_count_b": 5,
-                "abc_count_c": 2,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {}
-        }
-        
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
-        
-        db_reader = duckdb.connect(":memory:")
-        
-        # Create audit narrative sheet
-        writer._create_audit_narrative_sheet(
-            report_data=report_data,
-            run_context=run_context,
-            db_reader=db_reader,
-            run_id="test_run_123"
-        )
-        
-        # Verify sheet was created
-        assert "AuditNarrative" in writer.sheets
-        
-        # Close workbook
-        writer.workbook.close()
-    
     def test_chunked_data_writing(self, tmp_path):
         """Data should be written in chunks for constant memory mode."""
         excel_path = tmp_path / "test_report.xlsx"
@@ -250,11 +241,11 @@ class TestExcelWriter:
         columns = ["Col1", "Col2", "Col3"]
         row = writer.write_table_header(sheet, 0, columns)
         
-        # Create large dataset (2000 rows)
-        data = [
+        # Create large dataset (2000 rows), generated lazily
+        data = (
             {"Col1": f"Value{i}", "Col2": i, "Col3": i * 2}
             for i in range(2000)
-        ]
+        )
         
         # Write in chunks (should handle 2000 rows)
         final_row = writer.write_table_data_chunked(
@@ -264,7 +255,7 @@ class TestExcelWriter:
         # Verify all rows were written
         assert final_row == row + 2000
         
-        writer.workbook.close()
+        writer.close()
     
     def test_max_rows_limit(self, tmp_path):
         """max_rows parameter should limit the number of rows written."""
@@ -276,11 +267,11 @@ class TestExcelWriter:
         columns = ["Col1", "Col2"]
         row = writer.write_table_header(sheet, 0, columns)
         
-        # Create dataset larger than max_rows
-        data = [
+        # Create dataset larger than max_rows, generated lazily
+        data = (
             {"Col1": f"Value{i}", "Col2": i}
             for i in range(5000)
-        ]
+        )
         
         # Write with max_rows=1000
         final_row = writer.write_table_data_chunked(
@@ -290,7 +281,10 @@ class TestExcelWriter:
         # Verify only 1000 rows were written
         assert final_row == row + 1000
         
-        writer.workbook.close()
+        # Rows beyond max_rows are never pulled from the iterable
+        assert next(data)["Col1"] == "Value1000"
+        
+        writer.close()
     
     def test_excel_formats(self, tmp_path):
         """Excel should have proper cell formats."""
@@ -307,94 +301,60 @@ class TestExcelWriter:
         assert "medium_risk" in writer.formats
         assert "genai" in writer.formats
         
-        writer.workbook.close()
+        writer.close()
+    
+    def test_chunked_writer_reuses_formats(self, tmp_path):
+        """Writing rows must not register new formats (xlsxwriter keeps every Format)."""
+        excel_path = tmp_path / "test_report.xlsx"
+        writer = ExcelWriter(excel_path)
+        
+        sheet = writer.add_sheet("TestSheet")
+        columns = ["Service", "Risk", "usage_type", "BytesSent"]
+        row = writer.write_table_header(sheet, 0, columns)
+        
+        format_count = len(writer.workbook.formats)
+        data = [
+            {"Service": f"svc{i}", "Risk": ["high", "medium", "low"][i % 3],
+             "usage_type": "genai", "BytesSent": i}
+            for i in range(300)
+        ]
+        writer.write_table_data_chunked(sheet, row, columns, data,
+                                        column_formats={"BytesSent": "bytes"})
+        
+        assert len(writer.workbook.formats) == format_count
+        
+        writer.close()
+    
+    @pytest.mark.parametrize("columns, data, expected", [
+        pytest.param(["Col1"], [{"Col1": "a"}, {"Col1": "b"}], [("a",), ("b",)], id="single_column"),
+        pytest.param(["Col1", "Col2"], [{"Col1": "a", "Col2": 1}, {"Col1": "b"}],
+                     [("a", 1), ("b", None)], id="missing_key"),
+    ])
+    def test_chunked_writer_projects_dict_rows(self, tmp_path, columns, data, expected):
+        """Dict rows must land in column order, including one-column tables and missing keys."""
+        excel_path = tmp_path / "test_report.xlsx"
+        writer = ExcelWriter(excel_path)
+        
+        sheet = writer.add_sheet("TestSheet")
+        row = writer.write_table_header(sheet, 0, columns)
+        writer.write_table_data_chunked(sheet, row, columns, iter(data))
+        writer.close()
+        
+        sheet = openpyxl.load_workbook(excel_path, read_only=True)["TestSheet"]
+        rows = list(sheet.iter_rows(min_row=2, values_only=True))
+        assert [tuple(r[:len(columns)]) for r in rows] == expected
     
-    def test_excel_atomic_write(self, tmp_path):
+    def test_excel_atomic_write(self, tmp_path, db_reader):
         """Excel should be written atomically (no .tmp file left behind)."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
         report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 2,
-                "abc_count_b": 1,
-                "abc_count_c": 0,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {}
+            **_BASE_REPORT_DATA,
+            "counts": {**_BASE_REPORT_DATA["counts"], "abc_count_a": 2, "abc_count_b": 1, "abc_count_c": 0},
         }
         
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
-        
-        db_reader = duckdb.connect(":memory:")
-        
-        # Initialize minimal schema
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN,
-                first_seen TIMESTAMP,
-                last_seen TIMESTAMP,
-                burst_max_5min INTEGER
-            )
-        """)
-        
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS analysis_cache (
-                url_signature VARCHAR PRIMARY KEY,
-                service_name VARCHAR,
-                category VARCHAR,
-                risk_level VARCHAR,
-                usage_type VARCHAR,
-                status VARCHAR
-            )
-        """)
+        run_context = RunContext(run_id="test_run_123")
         
         # Generate Excel
         try:
@@ -406,7 +366,7 @@ class TestExcelWriter:
             )
         except Exception as e:
             try:
-                writer.workbook.close()
+                writer.close()
             except:
                 pass
             raise
@@ -418,263 +378,62 @@ class TestExcelWriter:
         tmp_files = list(excel_path.parent.glob("*.tmp"))
         assert len(tmp_files) == 0
     
-    def test_phase14_target_population_section(self, tmp_path):
-        """Phase 14: Target Population section must be present in audit narrative."""
+    def test_excel_failed_generation_leaves_no_file(self, tmp_path):
+        """A failed generation should leave neither the report nor its .tmp file."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 10,
-                "abc_count_b": 5,
-                "abc_count_c": 2,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {}
-        }
-        
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
+        run_context = RunContext(run_id="test_run_123")
         
+        # No tables: the first sheet query fails
         db_reader = duckdb.connect(":memory:")
         
-        # Initialize schema
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN,
-                bytes_sent_bucket VARCHAR
+        with pytest.raises(duckdb.CatalogException):
+            writer.generate_excel(
+                run_id="test_run_123",
+                report_data=_BASE_REPORT_DATA,
+                db_reader=db_reader,
+                run_context=run_context
             )
-        """)
-        
-        # Insert test data with non-A/B/C signatures
-        db_reader.execute("""
-            INSERT INTO signature_stats VALUES
-            ('test_run_123', 'sig1', 'example.com', 'example.com', 1048576, 10, 5, 'A', FALSE, 'H'),
-            ('test_run_123', 'sig2', 'test.com', 'test.com', 512000, 5, 3, 'B', FALSE, 'M'),
-            ('test_run_123', 'sig3', 'small.com', 'small.com', 1000, 1, 1, NULL, FALSE, 'T'),
-            ('test_run_123', 'sig4', 'tiny.com', 'tiny.com', 500, 1, 1, NULL, FALSE, 'T')
-        """)
-        
-        # Create audit narrative sheet
-        writer._create_audit_narrative_sheet(
-            report_data=report_data,
-            run_context=run_context,
-            db_reader=db_reader,
-            run_id="test_run_123"
-        )
         
-        # Verify sheet was created
-        assert "AuditNarrative" in writer.sheets
-        
-        # The sheet should contain Target Population section
-        # (We can't easily verify content without opening the file,
-        # but we can verify the method completes without errors)
-        
-        writer.workbook.close()
+        assert list(tmp_path.iterdir()) == []
     
-    def test_phase14_exclusion_counts(self, tmp_path):
-        """Phase 14: Exclusion counts should be displayed accurately."""
+    @pytest.mark.parametrize("overrides, sig_rows", [
+        # Required fields must render even without any DuckDB tables
+        pytest.param({}, None, id="required_fields"),
+        # Phase 14: exclusion counts must render for configured action filters
+        pytest.param({"exclusions": {"action_filter": ["block", "deny"]}}, None,
+                     id="exclusion_counts"),
+        # Phase 14: Target Population section over non-A/B/C signatures
+        pytest.param({}, [
+            ("test_run_123", "sig1", "example.com", "example.com", 1048576, 10, 5, "A", False, "H"),
+            ("test_run_123", "sig2", "test.com", "test.com", 512000, 5, 3, "B", False, "M"),
+            ("test_run_123", "sig3", "small.com", "small.com", 1000, 1, 1, None, False, "T"),
+            ("test_run_123", "sig4", "tiny.com", "tiny.com", 500, 1, 1, None, False, "T"),
+        ], id="target_population"),
+        # Phase 14: small volume zero exclusion proof (non-A/B/C signatures are counted)
+        pytest.param({}, [
+            ("test_run_123", "sig_a1", "example.com", "example.com", 1048576, 10, 5, "A", False, "H"),
+            ("test_run_123", "sig_b1", "test.com", "test.com", 512000, 5, 3, "B", False, "M"),
+            ("test_run_123", "sig_c1", "sample.com", "sample.com", 10000, 1, 1, "C", True, "S"),
+            ("test_run_123", "sig_small1", "small.com", "small.com", 1000, 1, 1, None, False, "T"),
+            ("test_run_123", "sig_small2", "tiny.com", "tiny.com", 500, 1, 1, None, False, "T"),
+        ], id="small_volume_zero_exclusion"),
+    ])
+    def test_audit_narrative_sheet(self, tmp_path, db_reader, overrides, sig_rows):
+        """Audit narrative sheet must be created for each report_data/signature case."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 10,
-                "abc_count_b": 5,
-                "abc_count_c": 2,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {
-                "action_filter": ["block", "deny"]
-            }
-        }
-        
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
-        
-        db_reader = duckdb.connect(":memory:")
-        
-        # Create audit narrative sheet with exclusions
-        writer._create_audit_narrative_sheet(
-            report_data=report_data,
-            run_context=run_context,
-            db_reader=db_reader,
-            run_id="test_run_123"
-        )
-        
-        # Verify sheet was created
-        assert "AuditNarrative" in writer.sheets
-        
-        writer.workbook.close()
-    
-    def test_phase14_small_volume_zero_exclusion(self, tmp_path):
-        """Phase 14: Small volume zero exclusion proof section must be present."""
-        excel_path = tmp_path / "test_report.xlsx"
-        writer = ExcelWriter(excel_path)
+        report_data = {**_BASE_REPORT_DATA, **overrides}
         
-        report_data = {
-            "run_id": "test_run_123",
-            "run_key": "test_key_456",
-            "started_at": datetime.utcnow().isoformat(),
-            "finished_at": datetime.utcnow().isoformat(),
-            "input_file": "/path/to/input.csv",
-            "vendor": "paloalto",
-            "thresholds_used": {
-                "A_min_bytes": 1048576,
-                "B_burst_count": 20,
-                "B_burst_window_seconds": 300,
-                "B_cumulative_bytes": 20971520,
-                "C_sample_rate": 0.02
-            },
-            "counts": {
-                "total_events": 1000,
-                "total_signatures": 100,
-                "unique_users": 50,
-                "unique_domains": 20,
-                "abc_count_a": 10,
-                "abc_count_b": 5,
-                "abc_count_c": 2,
-                "burst_hit": 1,
-                "cumulative_hit": 0
-            },
-            "sample": {
-                "sample_rate": 0.02,
-                "sample_method": "deterministic_hash",
-                "seed": "test_run_123"
-            },
-            "rule_coverage": {
-                "rule_hit": 80,
-                "unknown_count": 20
-            },
-            "llm_coverage": {
-                "llm_analyzed_count": 15,
-                "needs_review_count": 2,
-                "cache_hit_rate": 0.85,
-                "skipped_count": 3,
-                "llm_provider": "gemini",
-                "llm_model": "gemini-1.5-flash"
-            },
-            "signature_version": "1.0",
-            "rule_version": "1",
-            "prompt_version": "1",
-            "exclusions": {}
-        }
+        run_context = RunContext(run_id="test_run_123")
         
-        run_context = Mock()
-        run_context.run_id = "test_run_123"
-        
-        db_reader = duckdb.connect(":memory:")
-        
-        # Initialize schema
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN,
-                bytes_sent_bucket VARCHAR
-            )
-        """)
-        
-        # Insert test data: 10 A, 5 B, 2 C, and 83 non-A/B/C signatures
-        # This proves that small volume events are NOT excluded
-        db_reader.execute("""
-            INSERT INTO signature_stats VALUES
-            ('test_run_123', 'sig_a1', 'example.com', 'example.com', 1048576, 10, 5, 'A', FALSE, 'H'),
-            ('test_run_123', 'sig_b1', 'test.com', 'test.com', 512000, 5, 3, 'B', FALSE, 'M'),
-            ('test_run_123', 'sig_c1', 'sample.com', 'sample.com', 10000, 1, 1, 'C', TRUE, 'S'),
-            ('test_run_123', 'sig_small1', 'small.com', 'small.com', 1000, 1, 1, NULL, FALSE, 'T'),
-            ('test_run_123', 'sig_small2', 'tiny.com', 'tiny.com', 500, 1, 1, NULL, FALSE, 'T')
-        """)
+        if sig_rows is None:
+            # Bare connection: the narrative must tolerate missing tables
+            db_reader = duckdb.connect(":memory:")
+        else:
+            _insert_rows(db_reader, "signature_stats", SIG_COLUMNS + ("bytes_sent_bucket",), sig_rows)
         
         # Create audit narrative sheet
         writer._create_audit_narrative_sheet(
@@ -687,21 +446,21 @@ class TestExcelWriter:
         # Verify sheet was created
         assert "AuditNarrative" in writer.sheets
         
-        # Verify that non-A/B/C signatures are counted
-        # (extracted_count = 10 + 5 + 2 = 17, non-extracted = 1000 - 17 = 983)
-        # This proves zero exclusion of small volume events
+        writer.close()
         
-        writer.workbook.close()
+        # constant_memory writes inline strings, so section titles are in the sheet XML
+        with _open_xlsx_readonly(excel_path) as xlsx:
+            sheet_xml = xlsx.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        assert "Run Metadata" in sheet_xml
+        assert "Target Population" in sheet_xml
     
-    def test_phase15_department_risk_sheet(self, tmp_path):
+    def test_phase15_department_risk_sheet(self, tmp_path, db_reader):
         """Phase 15: Department Risk sheet should aggregate by user_dept."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        # Create processed directory structure
+        # Processed root; ParquetWriter creates vendor=<v>/date=<d>/ on write
         processed_dir = tmp_path / "data" / "processed"
-        vendor_dir = processed_dir / "vendor=paloalto" / "date=2024-01-15"
-        vendor_dir.mkdir(parents=True, exist_ok=True)
         
         # Create test Parquet file with user_dept data
         from ingestor.parquet_writer import ParquetWriter
@@ -771,51 +530,20 @@ class TestExcelWriter:
             }
         }
         
-        # Create mock DB reader with signature_stats and analysis_cache
-        db_reader = duckdb.connect(":memory:")
-        
-        # Initialize schema
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN
-            )
-        """)
-        
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS analysis_cache (
-                url_signature VARCHAR PRIMARY KEY,
-                service_name VARCHAR,
-                category VARCHAR,
-                risk_level VARCHAR,
-                usage_type VARCHAR,
-                status VARCHAR
-            )
-        """)
-        
         # Insert test data
         # Note: url_signature should match what's in Parquet
         # For simplicity, we'll use simple signatures
-        db_reader.execute("""
-            INSERT INTO signature_stats VALUES
-            ('test_run_123', 'sig1', 'example.com', 'example.com', 1048576, 1, 1, 'A', FALSE),
-            ('test_run_123', 'sig2', 'test.com', 'test.com', 512000, 1, 1, 'B', FALSE),
-            ('test_run_123', 'sig3', 'example.com', 'example.com', 256000, 1, 1, NULL, FALSE)
-        """)
-        
-        db_reader.execute("""
-            INSERT INTO analysis_cache VALUES
-            ('sig1', 'TestService', 'Business', 'high', 'genai', 'active'),
-            ('sig2', 'TestService2', 'Business', 'medium', 'business', 'active'),
-            ('sig3', 'TestService3', 'Business', 'low', 'business', 'active')
-        """)
+        _insert_rows(db_reader, "signature_stats", SIG_COLUMNS, [
+            ("test_run_123", "sig1", "example.com", "example.com", 1048576, 1, 1, "A", False),
+            ("test_run_123", "sig2", "test.com", "test.com", 512000, 1, 1, "B", False),
+            ("test_run_123", "sig3", "example.com", "example.com", 256000, 1, 1, None, False),
+        ])
+        
+        _insert_rows(db_reader, "analysis_cache", CACHE_COLUMNS, [
+            ("sig1", "TestService", "Business", "high", "genai", "active"),
+            ("sig2", "TestService2", "Business", "medium", "business", "active"),
+            ("sig3", "TestService3", "Business", "low", "business", "active"),
+        ])
         
         # Create department risk sheet
         # Note: The actual url_signature in Parquet may not match our test data
@@ -836,52 +564,86 @@ class TestExcelWriter:
             # Still verify sheet exists (even if empty)
             assert "DepartmentRisk" in writer.sheets
         
-        writer.workbook.close()
+        writer.close()
     
-    def test_phase15_time_series_sheet(self, tmp_path):
-        """Phase 15: Time Series sheet should aggregate by week."""
+    def test_department_risk_sheet_binds_parquet_paths(self, tmp_path, db_reader, monkeypatch):
+        """Department Risk should aggregate Parquet files passed as a bound path list."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        # Create processed directory structure
-        processed_dir = tmp_path / "data" / "processed"
-        vendor_dir = processed_dir / "vendor=paloalto" / "date=2024-01-15"
-        vendor_dir.mkdir(parents=True, exist_ok=True)
+        # A quote in the path must not need escaping in the SQL text
+        parquet_dir = tmp_path / "vendor's data"
+        parquet_dir.mkdir()
+        parquet_path = parquet_dir / "events.parquet"
+        pq.write_table(pa.table({
+            "user_dept": ["Engineering", "Engineering", "Sales"],
+            "user_id": ["user1", "user2", "user3"],
+            "url_signature": ["sig1", "sig2", "sig1"],
+        }), parquet_path)
+        monkeypatch.setattr(writer, "_collect_parquet_files", lambda vendor: [str(parquet_path)])
+        
+        _insert_rows(db_reader, "signature_stats", SIG_COLUMNS, [
+            ("test_run_123", "sig1", "example.com", "example.com", 1048576, 1, 1, "A", False),
+            ("test_run_123", "sig2", "test.com", "test.com", 512000, 1, 1, "B", False),
+        ])
+        _insert_rows(db_reader, "analysis_cache", CACHE_COLUMNS, [
+            ("sig1", "TestService", "Business", "high", "genai", "active"),
+            ("sig2", "TestService2", "Business", "medium", "business", "active"),
+        ])
+        
+        writer._create_department_risk_sheet(
+            report_data={**_BASE_REPORT_DATA, "vendor": "paloalto"},
+            db_reader=db_reader,
+            run_id="test_run_123"
+        )
+        writer.close()
         
-        # Create test Parquet file with time series data
-        from ingestor.parquet_writer import ParquetWriter
-        parquet_writer = ParquetWriter(base_dir=processed_dir)
+        sheet = openpyxl.load_workbook(excel_path, read_only=True)["DepartmentRisk"]
+        rows = list(sheet.iter_rows(min_row=2, values_only=True))
+        assert rows == [
+            ("Engineering", 2, 2, 0.5, 0.5, 1),
+            ("Sales", 1, 1, 1, 1, 1),
+        ]
+    
+    @pytest.mark.parametrize("create_sheet,sheet_name,first_row,expected", [
+        pytest.param("_create_department_risk_sheet", "DepartmentRisk",
+                     ("Engineering", 2, 2, 0.5, 0.5, 1.0),
+                     [("N/A (error: batch read failed)", 0, 0, 0, 0, 0)], id="department_risk"),
+        pytest.param("_create_time_series_sheet", "TimeSeries",
+                     ("2024-01", "Month", 10, 0.0, 0.5, 0.4, 0.0),
+                     [], id="time_series"),
+    ])
+    def test_sheet_query_error_after_first_row_falls_back(self, tmp_path, monkeypatch,
+                                                          create_sheet, sheet_name, first_row, expected):
+        """A failure mid-stream (later Arrow batch) must degrade the sheet, not abort the workbook."""
+        excel_path = tmp_path / "test_report.xlsx"
+        writer = ExcelWriter(excel_path)
         
-        # Create events across different weeks
-        test_events = []
-        for i in range(10):
-            # Week 1: 2024-01-08 to 2024-01-14
-            # Week 2: 2024-01-15 to 2024-01-21
-            week_offset = i % 2
-            day_offset = i % 7
-            event_time = f"2024-01-{8 + week_offset * 7 + day_offset}T10:00:00Z"
-            
-            test_events.append({
-                "event_time": event_time,
-                "vendor": "paloalto",
-                "log_type": "web",
-                "user_id": f"user{i}",
-                "dest_host": "example.com",
-                "dest_domain": "example.com",
-                "url_full": f"https://example.com/path{i}",
-                "action": "block" if i % 3 == 0 else "allow",
-                "bytes_sent": 1024 * (i + 1),
-                "bytes_received": 2048 * (i + 1),
-                "ingest_file": "test.csv",
-                "ingest_lineage_hash": f"{i}" * 64
-            })
+        def failing_rows(db_reader, query, params=None, batch_size=10_000):
+            yield first_row
+            raise duckdb.IOException("batch read failed")
         
-        parquet_path = parquet_writer.write_events(
-            events=test_events,
-            vendor="paloalto",
+        monkeypatch.setattr(writer, "_collect_parquet_files", lambda vendor: ["events.parquet"])
+        monkeypatch.setattr(writer, "_iter_rows", failing_rows)
+        
+        getattr(writer, create_sheet)(
+            report_data={**_BASE_REPORT_DATA, "vendor": "paloalto"},
+            db_reader=None,
             run_id="test_run_123"
         )
+        writer.close()
+        
+        sheet = openpyxl.load_workbook(excel_path, read_only=True)[sheet_name]
+        assert list(sheet.iter_rows(min_row=2, values_only=True)) == expected
+    
+    def test_phase15_time_series_sheet(self, tmp_path, db_reader, time_series_parquet, monkeypatch):
+        """Phase 15: Time Series sheet should aggregate by week."""
+        excel_path = tmp_path / "test_report.xlsx"
+        writer = ExcelWriter(excel_path)
         
+        monkeypatch.setattr(writer, "_collect_parquet_files", lambda vendor: [str(time_series_parquet)])
+        
+        n = _TIME_SERIES_EVENTS
         report_data = {
             "run_id": "test_run_123",
             "vendor": "paloalto",
@@ -891,64 +653,35 @@ class TestExcelWriter:
             }
         }
         
-        # Create mock DB reader
-        db_reader = duckdb.connect(":memory:")
-        
-        # Initialize schema
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                dest_domain VARCHAR,
-                bytes_sent_sum BIGINT,
-                access_count BIGINT,
-                unique_users BIGINT,
-                candidate_flags VARCHAR,
-                sampled BOOLEAN
-            )
-        """)
-        
-        db_reader.execute("""
-            CREATE TABLE IF NOT EXISTS analysis_cache (
-                url_signature VARCHAR PRIMARY KEY,
-                service_name VARCHAR,
-                category VARCHAR,
-                risk_level VARCHAR,
-                usage_type VARCHAR,
-                status VARCHAR
-            )
-        """)
-        
         # Insert test data
-        for i in range(10):
-            db_reader.execute(f"""
-                INSERT INTO signature_stats VALUES
-                ('test_run_123', 'sig{i}', 'example.com', 'example.com', {1024 * (i + 1)}, 1, 1, NULL, FALSE)
-            """)
-            
-            risk_level = 'high' if i % 3 == 0 else 'low'
-            usage_type = 'genai' if i % 2 == 0 else 'business'
-            
-            db_reader.execute(f"""
-                INSERT INTO analysis_cache VALUES
-                ('sig{i}', 'TestService{i}', 'Business', '{risk_level}', '{usage_type}', 'active')
-            """)
+        _insert_rows(db_reader, "signature_stats", SIG_COLUMNS, [
+            ("test_run_123", _SEED_SIGS[i], "example.com", "example.com", 1024 * (i + 1), 1, 1, None, False)
+            for i in range(n)
+        ])
+        
+        _insert_rows(db_reader, "analysis_cache", CACHE_COLUMNS, [
+            (_SEED_SIGS[i], f"TestService{i}", "Business",
+             "high" if i % 3 == 0 else "low",
+             "genai" if i % 2 == 0 else "business",
+             "active")
+            for i in range(n)
+        ])
+        
+        # Create time series sheet (query errors fall back to an empty table
+        # inside the sheet, so the period rows below prove the query ran)
+        writer._create_time_series_sheet(
+            report_data=report_data,
+            db_reader=db_reader,
+            run_id="test_run_123"
+        )
+        assert "TimeSeries" in writer.sheets
         
-        # Create time series sheet
-        try:
-            writer._create_time_series_sheet(
-                report_data=report_data,
-                db_reader=db_reader,
-                run_id="test_run_123"
-            )
-            
-            # Verify sheet was created
-            assert "TimeSeries" in writer.sheets
-        except Exception as e:
-            # If Parquet reading fails, that's okay for this test
-            print(f"Note: Time series sheet creation had expected issues: {e}")
-            # Still verify sheet exists
-            assert "TimeSeries" in writer.sheets
+        writer.close()
         
-        writer.workbook.close()
\ No newline at end of file
+        sheet = openpyxl.load_workbook(excel_path, read_only=True)["TimeSeries"]
+        periods = [row[:3] for row in sheet.iter_rows(min_row=2, values_only=True)]
+        assert periods == [
+            ("2024-01", "Month", 10),
+            ("2024-W02", "Week", 5),
+            ("2024-W03", "Week", 5),
+        ]
\ No newline at end of file
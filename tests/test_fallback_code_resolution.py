@@ -11,6 +11,7 @@ from the Standard Adapter with proper priority:
 """
 
 import pytest
+from functools import lru_cache
 from unittest.mock import Mock, MagicMock, patch
 import sys
 from pathlib import Path
@@ -18,99 +19,89 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Pure mock tests: one xdist worker keeps the module-scoped client fixture shared
+pytestmark = [pytest.mark.no_db, pytest.mark.xdist_group("mocks")]
 
-class TestFallbackCodeResolution:
-    """Test _get_fallback_code() priority logic."""
-    
-    @pytest.fixture
-    def mock_taxonomy_adapter(self):
-        """Create a mock taxonomy adapter."""
-        adapter = Mock()
-        return adapter
+
+@lru_cache(maxsize=None)
+def _label_lookup(items):
+    """
+    get_code_label side_effect over a (code, label) table (unknown codes -> "").
     
-    @pytest.fixture
-    def llm_client_with_mock_adapter(self, mock_taxonomy_adapter):
-        """Create LLMClient with mocked taxonomy adapter."""
-        with patch('llm.client.yaml.safe_load', return_value={
-            'default_provider': 'gemini',
-            'providers': {'gemini': {'model': 'gemini-2.0-flash'}},
-            'budget': {'daily_limit_usd': 10.0},
-            'batching': {}
-        }):
-            with patch('llm.client.json.load', return_value={}):
-                with patch('builtins.open', create=True):
-                    with patch.object(Path, 'exists', return_value=True):
-                        from llm.client import LLMClient
-                        client = LLMClient.__new__(LLMClient)
-                        # Minimal initialization
-                        client._taxonomy_adapter = mock_taxonomy_adapter
-                        client._fallback_code_cache = {}
-                        client.aimo_standard_version = "0.1.1"
-                        return client
+    Cached per table, so tests sharing a table share one lookup.
+    """
+    labels = dict(items)
     
-    def test_priority_1_unknown_in_label(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """Code with 'Unknown' in label should be selected first."""
-        client = llm_client_with_mock_adapter
-        
-        # Setup mock: FS-001 = "Known Service", FS-002 = "Unknown Function", FS-099 = "Other"
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002", "FS-099"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Known Service",
-            "FS-002": "Unknown Function",
-            "FS-099": "Other Service"
-        }.get(code, "")
-        
-        result = client._get_fallback_code("FS")
-        
-        assert result == "FS-002", "Should select code with 'Unknown' in label"
+    def get_code_label(code):
+        return labels.get(code, "")
+    return get_code_label
+
+
+@pytest.fixture(scope="module")
+def mock_taxonomy_adapter():
+    """Create a mock taxonomy adapter (shared by the module; reset per test)."""
+    adapter = Mock()
+    return adapter
+
+
+@pytest.fixture(scope="module")
+def llm_client_with_mock_adapter(llm_client_factory, mock_taxonomy_adapter):
+    """Create LLMClient with mocked taxonomy adapter (built once per module)."""
+    return llm_client_factory(mock_taxonomy_adapter)
+
+
+class TestFallbackCodeResolution:
+    """Test _get_fallback_code() priority logic."""
     
-    def test_priority_2_other_in_label(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """Code with 'Other' in label should be selected if no 'Unknown'."""
-        client = llm_client_with_mock_adapter
-        
-        # Setup mock: No "Unknown", but "Other" exists
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002", "FS-003"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Known Service",
-            "FS-002": "Business Function",
-            "FS-003": "Other Service"
-        }.get(code, "")
-        
-        result = client._get_fallback_code("FS")
-        
-        assert result == "FS-003", "Should select code with 'Other' in label"
+    # (code, label) tables for the adapter mock; hashable so _label_lookup can cache them
+    LABELS_UNKNOWN = (("FS-001", "Known Service"), ("FS-002", "Unknown Function"), ("FS-099", "Other Service"))
+    LABELS_OTHER = (("FS-001", "Known Service"), ("FS-002", "Business Function"), ("FS-003", "Other Service"))
+    LABELS_099 = (("FS-001", "Service A"), ("FS-002", "Service B"), ("FS-099", "Unclassified"))  # No "Unknown"/"Other"
+    LABELS_PLAIN = (("FS-001", "Service A"), ("FS-002", "Service B"), ("FS-003", "Service C"))
+    LABELS_CACHED = (("FS-001", "Service A"), ("FS-002", "Unknown Function"))
+    LABELS_UNKNOWN_UPPER = (("FS-001", "Service A"), ("FS-002", "UNKNOWN Function"))
+    LABELS_OTHER_UPPER = (("FS-001", "Service A"), ("FS-002", "OTHER Service"))
+    LABELS_MULTI_DIM = (
+        ("FS-001", "Service A"),
+        ("FS-002", "Unknown Service"),
+        ("IM-001", "Model A"),
+        ("IM-099", "Other Model"),
+        ("UC-001", "Use Case A"),
+        ("UC-002", "Use Case B"),
+        ("UC-003", "Use Case C"),
+    )
+    ALLOWED_CODES_BY_DIM = {
+        "FS": ["FS-001", "FS-002"],
+        "IM": ["IM-001", "IM-099"],
+        "UC": ["UC-001", "UC-002", "UC-003"]
+    }
     
-    def test_priority_3_code_ending_099(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """Code ending in -099 should be selected if no label match."""
-        client = llm_client_with_mock_adapter
-        
-        # Setup mock: No "Unknown" or "Other" labels, but -099 exists
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002", "FS-099"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Service A",
-            "FS-002": "Service B",
-            "FS-099": "Unclassified"  # No "Unknown" or "Other"
-        }.get(code, "")
-        
-        result = client._get_fallback_code("FS")
-        
-        assert result == "FS-099", "Should select code ending in -099"
+    @pytest.fixture(autouse=True)
+    def _reset_client_state(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
+        """Give each test a clean adapter mock and an empty fallback cache."""
+        mock_taxonomy_adapter.reset_mock(return_value=True, side_effect=True)
+        llm_client_with_mock_adapter._taxonomy_adapter = mock_taxonomy_adapter
+        llm_client_with_mock_adapter._fallback_code_cache.clear()
     
-    def test_priority_4_last_code(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """Last code should be selected if no other match."""
+    @pytest.mark.parametrize("allowed_codes,labels,expected", [
+        pytest.param(["FS-001", "FS-002", "FS-099"], LABELS_UNKNOWN, "FS-002", id="priority_1_unknown_in_label"),
+        pytest.param(["FS-001", "FS-002", "FS-003"], LABELS_OTHER, "FS-003", id="priority_2_other_in_label"),
+        pytest.param(["FS-001", "FS-002", "FS-099"], LABELS_099, "FS-099", id="priority_3_code_ending_099"),
+        pytest.param(["FS-001", "FS-002", "FS-003"], LABELS_PLAIN, "FS-003", id="priority_4_last_code"),
+        pytest.param(["FS-001", "FS-002"], LABELS_UNKNOWN_UPPER, "FS-002", id="case_insensitive_unknown"),
+        pytest.param(["FS-001", "FS-002"], LABELS_OTHER_UPPER, "FS-002", id="case_insensitive_other"),
+    ])
+    def test_priority_resolution(self, llm_client_with_mock_adapter, mock_taxonomy_adapter,
+                                 allowed_codes, labels, expected):
+        """Unknown label > Other label (case-insensitive) > -099 code > last code."""
         client = llm_client_with_mock_adapter
         
-        # Setup mock: No "Unknown", "Other", or -099
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002", "FS-003"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Service A",
-            "FS-002": "Service B",
-            "FS-003": "Service C"
-        }.get(code, "")
+        mock_taxonomy_adapter.get_allowed_codes.return_value = allowed_codes
+        mock_taxonomy_adapter.get_code_label.side_effect = _label_lookup(labels)
         
         result = client._get_fallback_code("FS")
         
-        assert result == "FS-003", "Should select last code in allowed codes"
+        assert result == expected
     
     def test_priority_5_static_fallback_no_adapter(self, llm_client_with_mock_adapter):
         """Static fallback should be used if adapter unavailable."""
@@ -126,10 +117,7 @@ class TestFallbackCodeResolution:
         client = llm_client_with_mock_adapter
         
         mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Service A",
-            "FS-002": "Unknown Function"
-        }.get(code, "")
+        mock_taxonomy_adapter.get_code_label.side_effect = _label_lookup(self.LABELS_CACHED)
         
         # First call
         result1 = client._get_fallback_code("FS")
@@ -145,25 +133,10 @@ class TestFallbackCodeResolution:
         client = llm_client_with_mock_adapter
         
         def mock_get_allowed_codes(dim):
-            return {
-                "FS": ["FS-001", "FS-002"],
-                "IM": ["IM-001", "IM-099"],
-                "UC": ["UC-001", "UC-002", "UC-003"]
-            }.get(dim, [])
-        
-        def mock_get_code_label(code):
-            return {
-                "FS-001": "Service A",
-                "FS-002": "Unknown Service",
-                "IM-001": "Model A",
-                "IM-099": "Other Model",
-                "UC-001": "Use Case A",
-                "UC-002": "Use Case B",
-                "UC-003": "Use Case C"
-            }.get(code, "")
+            return self.ALLOWED_CODES_BY_DIM.get(dim, [])
         
         mock_taxonomy_adapter.get_allowed_codes.side_effect = mock_get_allowed_codes
-        mock_taxonomy_adapter.get_code_label.side_effect = mock_get_code_label
+        mock_taxonomy_adapter.get_code_label.side_effect = _label_lookup(self.LABELS_MULTI_DIM)
         
         fs_result = client._get_fallback_code("FS")
         im_result = client._get_fallback_code("IM")
@@ -192,89 +165,45 @@ class TestFallbackCodeResolution:
         result = client._get_fallback_code("FS")
         
         assert result == "FS-099", "Should use static fallback on adapter exception"
-    
-    def test_case_insensitive_unknown_match(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """'Unknown' match should be case-insensitive."""
-        client = llm_client_with_mock_adapter
-        
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Service A",
-            "FS-002": "UNKNOWN Function"  # Uppercase
-        }.get(code, "")
-        
-        result = client._get_fallback_code("FS")
-        
-        assert result == "FS-002", "Should match 'UNKNOWN' case-insensitively"
-    
-    def test_case_insensitive_other_match(self, llm_client_with_mock_adapter, mock_taxonomy_adapter):
-        """'Other' match should be case-insensitive."""
-        client = llm_client_with_mock_adapter
-        
-        mock_taxonomy_adapter.get_allowed_codes.return_value = ["FS-001", "FS-002"]
-        mock_taxonomy_adapter.get_code_label.side_effect = lambda code: {
-            "FS-001": "Service A",
-            "FS-002": "OTHER Service"  # Uppercase
-        }.get(code, "")
-        
-        result = client._get_fallback_code("FS")
-        
-        assert result == "FS-002", "Should match 'OTHER' case-insensitively"
 
 
 class TestUnknownClassificationUsesFallback:
     """Test that _get_unknown_classification uses _get_fallback_code."""
     
-    def test_unknown_classification_uses_dynamic_codes(self):
+    def test_unknown_classification_uses_dynamic_codes(self, llm_client_factory):
         """_get_unknown_classification should use _get_fallback_code for all dimensions."""
-        with patch('llm.client.yaml.safe_load', return_value={
-            'default_provider': 'gemini',
-            'providers': {'gemini': {'model': 'gemini-2.0-flash'}},
-            'budget': {'daily_limit_usd': 10.0},
-            'batching': {}
-        }):
-            with patch('llm.client.json.load', return_value={}):
-                with patch('builtins.open', create=True):
-                    with patch.object(Path, 'exists', return_value=True):
-                        from llm.client import LLMClient
-                        client = LLMClient.__new__(LLMClient)
-                        
-                        # Setup mock adapter that returns specific codes
-                        mock_adapter = Mock()
-                        mock_adapter.get_allowed_codes.return_value = ["XX-001", "XX-UNKNOWN"]
-                        mock_adapter.get_code_label.side_effect = lambda code: {
-                            "XX-001": "Normal",
-                            "XX-UNKNOWN": "Unknown Category"
-                        }.get(code, "")
-                        
-                        client._taxonomy_adapter = mock_adapter
-                        client._fallback_code_cache = {}
-                        client.aimo_standard_version = "0.1.1"
-                        
-                        # Mock _get_fallback_code to track calls
-                        fallback_calls = []
-                        original_get_fallback = client._get_fallback_code
-                        
-                        def mock_get_fallback(dim):
-                            fallback_calls.append(dim)
-                            # Return predictable codes for testing
-                            return f"{dim}-FALLBACK"
-                        
-                        client._get_fallback_code = mock_get_fallback
-                        
-                        result = client._get_unknown_classification()
-                        
-                        # Verify _get_fallback_code was called for each dimension
-                        assert "FS" in fallback_calls
-                        assert "IM" in fallback_calls
-                        assert "UC" in fallback_calls
-                        assert "DT" in fallback_calls
-                        assert "CH" in fallback_calls
-                        assert "RS" in fallback_calls
-                        assert "LG" in fallback_calls
-                        
-                        # Verify result uses fallback codes
-                        assert result["fs_code"] == "FS-FALLBACK"
-                        assert result["im_code"] == "IM-FALLBACK"
-                        assert result["uc_codes"] == ["UC-FALLBACK"]
-                        assert result["ob_codes"] == []  # OB should be empty
+        # Setup mock adapter that returns specific codes
+        mock_adapter = Mock()
+        mock_adapter.get_allowed_codes.return_value = ["XX-001", "XX-UNKNOWN"]
+        labels = (("XX-001", "Normal"), ("XX-UNKNOWN", "Unknown Category"))
+        mock_adapter.get_code_label.side_effect = _label_lookup(labels)
+        
+        client = llm_client_factory(mock_adapter)
+        
+        # Mock _get_fallback_code to track calls
+        fallback_calls = []
+        original_get_fallback = client._get_fallback_code
+        
+        def mock_get_fallback(dim):
+            fallback_calls.append(dim)
+            # Return predictable codes for testing
+            return f"{dim}-FALLBACK"
+        
+        client._get_fallback_code = mock_get_fallback
+        
+        result = client._get_unknown_classification()
+        
+        # Verify _get_fallback_code was called for each dimension
+        assert "FS" in fallback_calls
+        assert "IM" in fallback_calls
+        assert "UC" in fallback_calls
+        assert "DT" in fallback_calls
+        assert "CH" in fallback_calls
+        assert "RS" in fallback_calls
+        assert "LG" in fallback_calls
+        
+        # Verify result uses fallback codes
+        assert result["fs_code"] == "FS-FALLBACK"
+        assert result["im_code"] == "IM-FALLBACK"
+        assert result["uc_codes"] == ["UC-FALLBACK"]
+        assert result["ob_codes"] == []  # OB should be empty
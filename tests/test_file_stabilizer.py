@@ -9,9 +9,8 @@ is tested via integration tests. See README_TESTS.md.
 """
 
 import pytest
-import tempfile
-import shutil
 import time
+import os
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -31,10 +30,11 @@ from orchestrator.file_stabilizer import FileStabilizer
 class TestFileStabilizer:
     """Test file stabilization functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """Set up test fixtures (in tmp_path; pytest prunes old base dirs, no per-test rmtree)."""
         # Create temporary directories
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
         self.input_dir = self.temp_dir / "input"
         self.work_dir = self.temp_dir / "work"
         self.config_dir = self.temp_dir / "config"
@@ -48,11 +48,6 @@ class TestFileStabilizer:
         self.config_path = self.config_dir / "box_sync.yaml"
         self._create_test_config()
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
     def _create_test_config(self):
         """Create test configuration file."""
         config_content = """# Test Box Sync Configuration
@@ -140,10 +135,12 @@ work:
         import threading
         
         def modify_file():
-            time.sleep(0.5)
-            test_file.write_text("modified")
-            time.sleep(0.5)
-            test_file.write_text("final")
+            # Metadata-only changes (no data rewrite): shrink the file, bump mtime
+            for size in (3, 1):
+                time.sleep(0.5)
+                os.truncate(test_file, size)
+                now_ns = time.time_ns()
+                os.utime(test_file, ns=(now_ns, now_ns))
         
         thread = threading.Thread(target=modify_file)
         thread.start()
@@ -351,9 +348,10 @@ work:
 class TestFileStabilizerIntegration:
     """Integration tests for file stabilizer with main pipeline."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """Set up test fixtures (in tmp_path; pytest prunes old base dirs, no per-test rmtree)."""
+        self.temp_dir = tmp_path
         self.input_dir = self.temp_dir / "input"
         self.work_dir = self.temp_dir / "work"
         self.config_dir = self.temp_dir / "config"
@@ -381,11 +379,6 @@ work:
         with open(self.config_path, 'w') as f:
             f.write(config_content)
     
-    def teardown_method(self):
-        """Clean up."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
     def test_work_directory_structure(self):
         """Test that work directory structure is correct."""
         # Create test file
@@ -415,9 +408,10 @@ work:
 class TestFileStabilizerAuditLogging:
     """Test audit logging for file stabilization."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """Set up test fixtures (in tmp_path; pytest prunes old base dirs, no per-test rmtree)."""
+        self.temp_dir = tmp_path
         self.input_dir = self.temp_dir / "input"
         self.work_dir = self.temp_dir / "work"
         self.config_dir = self.temp_dir / "config"
@@ -453,11 +447,6 @@ work:
         from orchestrator.jsonl_logger import JSONLLogger
         self.jsonl_logger = JSONLLogger(self.logs_dir)
     
-    def teardown_method(self):
-        """Clean up."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
     def test_stabilization_audit_log(self):
         """Test that stabilization is logged to audit log."""
         # Create test file
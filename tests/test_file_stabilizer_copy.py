@@ -0,0 +1,204 @@
+"""
+Tests for the file stabilizer copy path (_fastcopy) and input discovery.
+
+Unlike test_file_stabilizer.py these do not depend on stabilization timing:
+the kernel copy calls and directory listings are stubbed to reproduce
+filesystem quirks.
+"""
+
+from concurrent.futures import Future
+import errno
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import orchestrator.file_stabilizer as file_stabilizer
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """5000-byte source file."""
+    src = tmp_path / "source.csv"
+    src.write_bytes(os.urandom(5000))
+    return src
+
+
+@pytest.fixture
+def no_reflink(monkeypatch):
+    """Force the copy past FICLONE (as on ext4 / network mounts)."""
+    monkeypatch.setattr(file_stabilizer, "_reflink", lambda src_fd, dst_fd: False)
+
+
+class TestFastCopy:
+    """Test _fastcopy fallbacks."""
+    
+    def test_zero_return_falls_back_to_buffered_copy(self, tmp_path, source_file, no_reflink, monkeypatch):
+        """copy_file_range/sendfile returning 0 (FUSE/network quirk) must not yield a short copy."""
+        monkeypatch.setattr(file_stabilizer.os, "copy_file_range", lambda *args: 0, raising=False)
+        monkeypatch.setattr(file_stabilizer.os, "sendfile", lambda *args: 0, raising=False)
+        dest = tmp_path / "dest.csv"
+        
+        file_stabilizer._fastcopy(source_file, dest)
+        
+        assert dest.read_bytes() == source_file.read_bytes()
+    
+    def test_partial_then_zero_falls_back_to_buffered_copy(self, tmp_path, source_file, no_reflink, monkeypatch):
+        """A copy that stops part-way is redone from scratch, not left truncated."""
+        real_copy_file_range = os.copy_file_range
+        
+        def partial_copy_file_range(src_fd, dst_fd, count, offset_src=None, offset_dst=None):
+            if offset_src:
+                return 0
+            return real_copy_file_range(src_fd, dst_fd, min(count, 1000), offset_src)
+        
+        monkeypatch.setattr(file_stabilizer.os, "copy_file_range", partial_copy_file_range)
+        monkeypatch.setattr(file_stabilizer.os, "sendfile", lambda *args: 0, raising=False)
+        dest = tmp_path / "dest.csv"
+        
+        file_stabilizer._fastcopy(source_file, dest)
+        
+        assert dest.read_bytes() == source_file.read_bytes()
+    
+    def test_short_copy_raises(self, tmp_path, source_file, no_reflink, monkeypatch):
+        """If every path comes up short, the copy fails instead of succeeding silently."""
+        monkeypatch.setattr(file_stabilizer.os, "copy_file_range", lambda *args: 0, raising=False)
+        monkeypatch.setattr(file_stabilizer.os, "sendfile", lambda *args: 0, raising=False)
+        monkeypatch.setattr(file_stabilizer, "_buffered_copy", lambda fsrc, fdst, size: None)
+        dest = tmp_path / "dest.csv"
+        
+        with pytest.raises(OSError) as exc_info:
+            file_stabilizer._fastcopy(source_file, dest)
+        
+        assert exc_info.value.errno == errno.EIO
+        # No dest.csv (a re-run would reuse it as copied) and no temp file left behind
+        assert list(tmp_path.iterdir()) == [source_file]
+    
+    def test_missing_source_leaves_nothing(self, tmp_path):
+        """A source that vanished before the copy leaves no partial or temp file."""
+        dest = tmp_path / "dest.csv"
+        
+        with pytest.raises(FileNotFoundError):
+            file_stabilizer._fastcopy(tmp_path / "missing.csv", dest)
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_source_grown_after_measuring_copies_measured_size(self, tmp_path, source_file, no_reflink, monkeypatch):
+        """Bytes appended after the size was taken are not copied (and do not fail the copy)."""
+        monkeypatch.setattr(file_stabilizer.os, "copy_file_range", lambda *args: 0, raising=False)
+        monkeypatch.setattr(file_stabilizer.os, "sendfile", lambda *args: 0, raising=False)
+        original = source_file.read_bytes()
+        real_buffered_copy = file_stabilizer._buffered_copy
+        
+        def grow_then_copy(fsrc, fdst, size):
+            with open(source_file, "ab") as f:
+                f.write(b"appended,row\n")
+            real_buffered_copy(fsrc, fdst, size)
+        
+        monkeypatch.setattr(file_stabilizer, "_buffered_copy", grow_then_copy)
+        dest = tmp_path / "dest.csv"
+        
+        file_stabilizer._fastcopy(source_file, dest)
+        
+        assert dest.read_bytes() == original
+
+
+@pytest.fixture
+def stabilizer_factory(tmp_path):
+    """Build a FileStabilizer whose input path is the given directory (or file)."""
+    def make_stabilizer(input_path, wait_seconds=1):
+        config_path = tmp_path / "box_sync.yaml"
+        config_path.write_text(
+            "enabled: false\n"
+            f'fallback_input_path: "{input_path}"\n'
+            "stabilization:\n"
+            f"  wait_seconds: {wait_seconds}\n"
+            "  poll_interval_seconds: 1\n"
+            "file_handling:\n"
+            '  include_patterns: ["*.csv"]\n'
+        )
+        return file_stabilizer.FileStabilizer(config_path=config_path)
+    return make_stabilizer
+
+
+class TestFindInputFiles:
+    """Test find_input_files directory walk."""
+    
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path, stabilizer_factory, monkeypatch):
+        """One unreadable folder must not abort discovery of the rest of the tree."""
+        input_dir = tmp_path / "input"
+        (input_dir / "locked").mkdir(parents=True)
+        (input_dir / "open").mkdir()
+        (input_dir / "top.csv").write_text("a,b\n")
+        (input_dir / "locked" / "hidden.csv").write_text("a,b\n")
+        (input_dir / "open" / "nested.csv").write_text("a,b\n")
+        stabilizer = stabilizer_factory(input_dir)
+        
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if Path(path).name == "locked":
+                raise PermissionError(errno.EACCES, "Permission denied", str(path))
+            return real_scandir(path)
+        
+        monkeypatch.setattr(file_stabilizer.os, "scandir", scandir)
+        
+        assert stabilizer.find_input_files() == [
+            input_dir / "open" / "nested.csv",
+            input_dir / "top.csv",
+        ]
+    
+    def test_input_path_is_file_returns_empty(self, tmp_path, stabilizer_factory):
+        """An input path that is a file yields no inputs (as Path.rglob did)."""
+        input_file = tmp_path / "input.csv"
+        input_file.write_text("a,b\n")
+        stabilizer = stabilizer_factory(input_file)
+        
+        assert stabilizer.find_input_files() == []
+
+
+class TestInterrupt:
+    """Test that an interrupted run stops waiting for files."""
+    
+    def test_stop_event_ends_wait(self, tmp_path, stabilizer_factory):
+        """A set stop event ends wait_for_stable with an error instead of waiting it out."""
+        input_file = tmp_path / "input.csv"
+        input_file.write_text("a,b\n")
+        stabilizer = stabilizer_factory(tmp_path, wait_seconds=60)
+        stop = threading.Event()
+        stop.set()
+        
+        result = stabilizer.wait_for_stable(input_file, stop=stop)
+        
+        assert not result["success"]
+        assert result["metadata"]["error"] == "Interrupted"
+    
+    def test_ctrl_c_does_not_wait_for_workers(self, tmp_path, stabilizer_factory, monkeypatch):
+        """KeyboardInterrupt while collecting results returns at once and the workers exit."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("a.csv", "b.csv"):
+            (input_dir / name).write_text("a,b\n")
+        stabilizer = stabilizer_factory(input_dir, wait_seconds=60)
+        
+        def interrupted_result(self, timeout=None):
+            time.sleep(0.2)  # let the workers start waiting
+            raise KeyboardInterrupt
+        
+        monkeypatch.setattr(Future, "result", interrupted_result)
+        workers_before = set(threading.enumerate())
+        
+        start = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            stabilizer.process_input_files(tmp_path / "work")
+        assert time.monotonic() - start < 5
+        
+        for thread in set(threading.enumerate()) - workers_before:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
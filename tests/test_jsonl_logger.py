@@ -250,6 +250,44 @@ class TestJSONLLogger:
         assert event["row_count"] == 1000
         assert event["metadata"]["bytes_read"] == 1024000
     
+    def test_file_stabilized_logging(self, tmp_path):
+        """Test file_stabilized event logging."""
+        logs_dir = tmp_path / "logs"
+        logger = JSONLLogger(logs_dir)
+        
+        logger.log_file_stabilized(
+            run_id="test_run_123",
+            source_path="/sync/input/ログ.csv",
+            dest_path="/work/test_run_123/raw/ログ.csv",
+            metadata={
+                "initial_size": 100,
+                "initial_mtime": 1700000000.5,
+                "final_size": 200,
+                "final_mtime": 1700000001.5,
+                "wait_duration_seconds": 3.2,
+                "stable_duration_seconds": 2.0,
+                "change_count": 1
+            },
+            stability_seconds=2
+        )
+        
+        # Read log file
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        log_file = logs_dir / f"{today}.jsonl"
+        
+        with open(log_file, "r", encoding="utf-8") as f:
+            line = f.readline()
+        event = json.loads(line)
+        
+        assert "ログ.csv" in line, "Non-ASCII paths should be written unescaped"
+        assert event["event_type"] == "file_stabilized"
+        assert event["run_id"] == "test_run_123"
+        assert event["source_path"] == "/sync/input/ログ.csv"
+        assert event["final_size"] == 200
+        assert event["change_count"] == 1
+        assert event["stability_seconds"] == 2
+        assert "timestamp" in event
+    
     def test_error_logging(self, tmp_path):
         """Test error event logging."""
         logs_dir = tmp_path / "logs"
@@ -0,0 +1,24 @@
+"""
+Tests for the Orchestrator public API surface.
+
+Import-only checks kept apart from the DB-backed bundle tests
+(test_evidence_bundle_generation.py) so they need no fixtures.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestOrchestratorIntegration:
+    """Tests for Orchestrator integration."""
+    
+    @pytest.mark.no_db
+    def test_orchestrator_has_generate_evidence_bundle(self):
+        """Test that Orchestrator has generate_evidence_bundle method."""
+        from orchestrator import Orchestrator
+        
+        assert hasattr(Orchestrator, 'generate_evidence_bundle')
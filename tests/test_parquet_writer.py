@@ -18,6 +18,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ingestor.parquet_writer import ParquetWriter
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 
@@ -327,6 +328,45 @@ class TestParquetWriter:
         table = parquet_file.read()
         assert len(table) == 1
     
+    def test_write_events_table_matches_write_events(self, tmp_path):
+        """Columnar writes should produce the same rows and schema as dict writes."""
+        writer = ParquetWriter(base_dir=tmp_path / "processed")
+        
+        events = [
+            {
+                "event_time": f"2024-01-15T10:0{i}:00Z",
+                "vendor": "paloalto",
+                "log_type": "web",
+                "user_id": f"user{i}",
+                "dest_host": "example.com",
+                "dest_domain": "example.com",
+                "url_full": f"https://example.com/path{i}",
+                "action": "allow",
+                "bytes_sent": 1024 * (i + 1),
+                "bytes_received": 2048 * (i + 1),
+                "ingest_file": "test.csv",
+                "ingest_lineage_hash": "a" * 64
+            }
+            for i in range(3)
+        ]
+        
+        dict_path = writer.write_events(events=events, vendor="paloalto", run_id="dicts")
+        table_path = writer.write_events_table(
+            pa.Table.from_pylist(events), vendor="paloalto", run_id="columns"
+        )
+        
+        # Same partition, canonical schema, nulls for omitted optional fields
+        assert table_path.parent == dict_path.parent
+        assert pq.read_table(str(table_path)).equals(pq.read_table(str(dict_path)))
+    
+    def test_write_events_table_rejects_empty_table(self, tmp_path):
+        """Empty columnar input should be rejected like an empty event list."""
+        writer = ParquetWriter(base_dir=tmp_path / "processed")
+        
+        with pytest.raises(ValueError):
+            writer.write_events_table(pa.table({"event_time": pa.array([], pa.string())}),
+                                      vendor="paloalto", run_id="test_run_123")
+    
     def test_get_partition_path(self, tmp_path):
         """get_partition_path should return correct partition directory."""
         processed_dir = tmp_path / "processed"
@@ -29,10 +29,8 @@ class TestPhase14ExclusionCounts:
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        # Create processed directory structure
+        # Processed root; ParquetWriter creates vendor=<v>/date=<d>/ on write
         processed_dir = tmp_path / "data" / "processed"
-        vendor_dir = processed_dir / "vendor=paloalto" / "date=2024-01-15"
-        vendor_dir.mkdir(parents=True, exist_ok=True)
         
         # Create test Parquet file with mixed actions
         parquet_writer = ParquetWriter(base_dir=processed_dir)
@@ -120,7 +118,7 @@ class TestPhase14ExclusionCounts:
         # Verify exclusion count is calculated (1 block event should be excluded)
         # The exclusion count should be 1 (block event when action_filter="allow")
         
-        writer.workbook.close()
+        writer.close()
     
     def test_exclusion_counts_no_parquet(self, tmp_path):
         """Exclusion counts should handle missing Parquet files gracefully."""
@@ -153,4 +151,4 @@ class TestPhase14ExclusionCounts:
         )
         
         assert "AuditNarrative" in writer.sheets
-        writer.workbook.close()
+        writer.close()
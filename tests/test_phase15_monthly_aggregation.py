@@ -12,6 +12,7 @@ import sys
 from datetime import datetime
 from unittest.mock import Mock
 import duckdb
+import pyarrow as pa
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -23,60 +24,37 @@ from ingestor.parquet_writer import ParquetWriter
 class TestPhase15MonthlyAggregation:
     """Test Phase 15: Monthly time series aggregation."""
     
-    def test_monthly_aggregation_in_time_series(self, tmp_path):
+    def test_monthly_aggregation_in_time_series(self, tmp_path, db_reader):
         """Time series sheet should include both weekly and monthly aggregation."""
         excel_path = tmp_path / "test_report.xlsx"
         writer = ExcelWriter(excel_path)
         
-        # Create processed directory structure
+        # Processed root; ParquetWriter creates vendor=<v>/date=<d>/ on write
         processed_dir = tmp_path / "data" / "processed"
-        vendor_dir = processed_dir / "vendor=paloalto" / "date=2024-01-15"
-        vendor_dir.mkdir(parents=True, exist_ok=True)
         
         # Create test Parquet file with events across multiple weeks and months
         parquet_writer = ParquetWriter(base_dir=processed_dir)
         
-        test_events = []
-        # Create events for January 2024 (week 1-4)
-        for i in range(20):
-            day = 1 + (i % 28)  # Days 1-28
-            event_time = f"2024-01-{day:02d}T10:00:00Z"
-            test_events.append({
-                "event_time": event_time,
-                "vendor": "paloalto",
-                "log_type": "web",
-                "user_id": f"user{i}",
-                "dest_host": "example.com",
-                "dest_domain": "example.com",
-                "url_full": f"https://example.com/path{i}",
-                "action": "allow",
-                "bytes_sent": 1024 * (i + 1),
-                "bytes_received": 2048 * (i + 1),
-                "ingest_file": "test.csv",
-                "ingest_lineage_hash": f"{i}" * 64
-            })
+        # 20 events in January 2024 (days 1-20, weeks 1-3) and 10 in February
+        # 2024 (days 1-10), built column-wise
+        n = 30
+        events_table = pa.Table.from_pydict({
+            "event_time": [f"2024-{1 + i // 20:02d}-{1 + i % 20:02d}T10:00:00Z" for i in range(n)],
+            "vendor": ["paloalto"] * n,
+            "log_type": ["web"] * n,
+            "user_id": [f"user{i}" for i in range(n)],
+            "dest_host": ["example.com"] * n,
+            "dest_domain": ["example.com"] * n,
+            "url_full": [f"https://example.com/path{i}" for i in range(n)],
+            "action": ["allow"] * n,
+            "bytes_sent": [1024 * (i + 1) for i in range(n)],
+            "bytes_received": [2048 * (i + 1) for i in range(n)],
+            "ingest_file": ["test.csv"] * n,
+            "ingest_lineage_hash": [f"{i}" * 64 for i in range(n)],
+        })
         
-        # Create events for February 2024 (different month)
-        for i in range(10):
-            day = 1 + (i % 28)
-            event_time = f"2024-02-{day:02d}T10:00:00Z"
-            test_events.append({
-                "event_time": event_time,
-                "vendor": "paloalto",
-                "log_type": "web",
-                "user_id": f"user{i+20}",
-                "dest_host": "example.com",
-                "dest_domain": "example.com",
-                "url_full": f"https://example.com/path{i+20}",
-                "action": "allow",
-                "bytes_sent": 1024 * (i + 21),
-                "bytes_received": 2048 * (i + 21),
-                "ingest_file": "test.csv",
-                "ingest_lineage_hash": f"{i+20}" * 64
-            })
-        
-        parquet_path = parquet_writer.write_events(
-            events=test_events,
+        parquet_path = parquet_writer.write_events_table(
+            events_table,
             vendor="paloalto",
             run_id="test_run_123"
         )
@@ -93,23 +71,14 @@ class TestPhase15MonthlyAggregation:
         run_context = Mock()
         run_context.run_id = "test_run_123"
         
-        # Create mock DB reader with signature_stats
-        db_reader = duckdb.connect(":memory:")
-        db_reader.execute("""
-            CREATE TABLE signature_stats (
-                run_id VARCHAR,
-                url_signature VARCHAR,
-                norm_host VARCHAR,
-                norm_path_template VARCHAR
-            )
-        """)
-        
-        # Insert test signature stats
-        for i in range(30):
-            db_reader.execute("""
-                INSERT INTO signature_stats VALUES
-                (?, ?, ?, ?)
-            """, ["test_run_123", f"sig_{i}", "example.com", f"/path{i}"])
+        # Insert test signature stats (schema from the shared db_reader fixture)
+        # as one multi-row VALUES statement
+        sig_rows = [("test_run_123", f"sig_{i}", "example.com", f"/path{i}") for i in range(30)]
+        values_sql = ", ".join(["(?, ?, ?, ?)"] * len(sig_rows))
+        db_reader.execute(f"""
+            INSERT INTO signature_stats (run_id, url_signature, norm_host, norm_path_template)
+            VALUES {values_sql}
+        """, [value for row in sig_rows for value in row])
         
         # Create time series sheet
         writer._create_time_series_sheet(
@@ -124,4 +93,4 @@ class TestPhase15MonthlyAggregation:
         # Verify that both weekly and monthly data are present
         # The query should return rows with PeriodType = 'Week' and 'Month'
         
-        writer.workbook.close()
+        writer.close()
@@ -478,3 +478,23 @@ class TestStandardAdapterIntegration:
             
         except ImportError:
             pytest.skip("Standard Adapter not available")
+    
+    def test_allowed_codes_bulk_matches_per_dimension(self):
+        """Test that get_allowed_codes_bulk returns the same codes as get_allowed_codes."""
+        try:
+            from standard_adapter.taxonomy import get_taxonomy_adapter
+            
+            adapter = get_taxonomy_adapter(version="0.1.1")
+            dims = ("FS", "IM", "UC", "DT", "CH", "RS", "LG")
+            bulk = adapter.get_allowed_codes_bulk(dims)
+            
+            assert list(bulk) == list(dims)
+            for dim in dims:
+                assert bulk[dim] == adapter.get_allowed_codes(dim)
+            
+            # Unknown dimension (EV was renamed to LG in 0.1.1)
+            with pytest.raises(ValueError):
+                adapter.get_allowed_codes_bulk(("FS", "EV"))
+            
+        except ImportError:
+            pytest.skip("Standard Adapter not available")